@@ -2,12 +2,26 @@
 
 import argparse
 import sys
-from pathlib import Path
+
+
+class _FastParser(argparse.ArgumentParser):
+    """ArgumentParser that reuses a single HelpFormatter.
+
+    On Python 3.14+ every ``add_argument`` builds a fresh formatter, which
+    re-checks terminal colour support each time. We only ever parse args
+    once, so sharing one formatter is safe.
+    """
+
+    def _get_formatter(self) -> argparse.HelpFormatter:
+        formatter = getattr(self, "_cached_formatter", None)
+        if formatter is None:
+            formatter = self._cached_formatter = self.formatter_class(prog=self.prog)
+        return formatter
 
 
 def _handle_subcommand() -> None:
     """Handle pin/unpin subcommands."""
-    parser = argparse.ArgumentParser(prog="ncview")
+    parser = _FastParser(prog="ncview")
     sub = parser.add_subparsers(dest="command")
 
     pin_p = sub.add_parser("pin", help="Pin a directory for quick navigation")
@@ -20,8 +34,8 @@ def _handle_subcommand() -> None:
     args = parser.parse_args()
 
     if args.command == "pin":
-        from ncview.utils.pins import add_pin
-        resolved = str(Path(args.path).resolve())
+        from ncview.utils.pins import add_pin, normalize_pin_path
+        resolved = normalize_pin_path(args.path)
         overwritten = add_pin(args.path, name=args.name)
         label = f" ({args.name})" if args.name else ""
         if overwritten:
@@ -29,8 +43,8 @@ def _handle_subcommand() -> None:
         else:
             print(f"Pinned: {resolved}{label}")
     elif args.command == "unpin":
-        from ncview.utils.pins import remove_pin
-        resolved = str(Path(args.path).resolve())
+        from ncview.utils.pins import normalize_pin_path, remove_pin
+        resolved = normalize_pin_path(args.path)
         remove_pin(args.path)
         print(f"Unpinned: {resolved}")
 
@@ -49,7 +63,13 @@ def main() -> None:
         print(f"config: {config_dir()}")
         return
 
-    parser = argparse.ArgumentParser(
+    # Fast path: plain `ncview` or `ncview <path>` needs no parser at all.
+    if len(sys.argv) == 1 or (len(sys.argv) == 2 and not sys.argv[1].startswith("-")):
+        from ncview.app import run
+        run(sys.argv[1] if len(sys.argv) == 2 else ".")
+        return
+
+    parser = _FastParser(
         prog="ncview",
         description="Terminal file browser with vim keybindings",
     )
@@ -2,24 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from pathlib import Path
 
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, VerticalScroll
-from textual.widgets import Header
+from textual.timer import Timer
+from textual.widgets import DataTable, Header, TabbedContent
+from textual.worker import Worker
 
+from ncview.utils.config import editor_command
 from ncview.utils.file_types import registry
 from ncview.utils.history import add_to_history
 from ncview.utils.pins import add_pin
-from ncview.viewers.csv_viewer import CsvViewer
-from ncview.viewers.fallback_viewer import FallbackViewer
-from ncview.viewers.json_viewer import JsonViewer
-from ncview.viewers.markdown_viewer import MarkdownViewer
-from ncview.viewers.parquet_viewer import ParquetViewer
-from ncview.viewers.text_viewer import TextViewer
-from ncview.viewers.toml_viewer import TomlViewer
-from ncview.viewers.yaml_viewer import YamlViewer
 from ncview.widgets.file_browser import (
     DirectoryChanged,
     FileBrowser,
@@ -30,15 +28,33 @@ from ncview.widgets.path_bar import PathBar
 from ncview.widgets.preview_panel import PreviewPanel
 from ncview.widgets.status_bar import StatusBar
 
-# Register viewers
-registry.register(TextViewer)
-registry.register(ParquetViewer)
-registry.register(CsvViewer)
-registry.register(JsonViewer)
-registry.register(MarkdownViewer)
-registry.register(YamlViewer)
-registry.register(TomlViewer)
-registry.register(FallbackViewer)
+# Bytes read ahead of the split preview to warm the page cache
+_PREFETCH_BYTES = 64 * 1024
+# Gap between highlights after which a move renders without debouncing
+_SPLIT_PAUSE = 0.5
+# Seconds without a highlight before the prefetch thread exits
+_PREFETCH_IDLE = 0.5
+
+
+def _register_viewers() -> None:
+    """Register the viewers, once at startup on the UI thread.
+
+    Text and fallback viewers are needed for almost any file, so they are
+    imported here. The rest register lazily and import on first match.
+    """
+    from ncview.viewers.fallback_viewer import FallbackViewer
+    from ncview.viewers.text_viewer import TextViewer
+
+    registry.register(TextViewer)
+    registry.register_lazy({".parquet"}, 10, "ncview.viewers.parquet_viewer:ParquetViewer")
+    registry.register_lazy({".csv", ".tsv", ".tab"}, 10, "ncview.viewers.csv_viewer:CsvViewer")
+    registry.register_lazy({".json", ".geojson", ".jsonl"}, 5, "ncview.viewers.json_viewer:JsonViewer")
+    registry.register_lazy(
+        {".md", ".markdown", ".mkd", ".mdx"}, 5, "ncview.viewers.markdown_viewer:MarkdownViewer",
+    )
+    registry.register_lazy({".yaml", ".yml"}, 5, "ncview.viewers.yaml_viewer:YamlViewer")
+    registry.register_lazy({".toml"}, 5, "ncview.viewers.toml_viewer:TomlViewer")
+    registry.register(FallbackViewer)
 
 
 class NcviewApp(App):
@@ -75,7 +91,18 @@ class NcviewApp(App):
         self._start_path = start_path or Path.cwd()
         self._preview_path: Path | None = None
         self._split_view = False
+        self._preview_open = False
         self._split_pending_path: Path | None = None
+        self._last_highlight = 0.0
+        self._split_timer: Timer | None = None
+        self._prefetch_path: Path | None = None
+        self._prefetch_wake = threading.Event()
+        self._prefetch_worker: Worker | None = None
+        # Held while a split preview swaps viewers, so callbacks can't interleave
+        self._split_lock = asyncio.Lock()
+        self._pending_history_path: Path | None = None
+        self._last_history_path: Path | None = None
+        self._scroll: VerticalScroll | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -86,17 +113,27 @@ class NcviewApp(App):
         yield StatusBar(id="status-bar")
 
     def on_mount(self) -> None:
+        _register_viewers()
         # Ensure Home pin exists
         add_pin(str(Path.home()), name="\uf015 Home")
-        browser = self.query_one("#browser", FileBrowser)
-        browser.border_title = "Files"
-        browser.focus()
-        preview = self.query_one("#preview", PreviewPanel)
-        preview.border_title = "Preview"
+        # Cache widget lookups — actions run on every keystroke
+        self._preview = self.query_one("#preview", PreviewPanel)
+        self._browser = self.query_one("#browser", FileBrowser)
+        self._status = self.query_one("#status-bar", StatusBar)
+        self._path_bar = self.query_one("#path-bar", PathBar)
+        self._browser.border_title = "Files"
+        self._browser.focus()
+        self._preview.border_title = "Preview"
 
     def _preview_is_open(self) -> bool:
         """True when in full-screen preview mode (not split)."""
-        return self.query_one("#preview", PreviewPanel).has_class("visible")
+        return self._preview_open
+
+    def _preview_scroll(self) -> VerticalScroll:
+        """Return the preview's scroll container, looked up once per preview."""
+        if self._scroll is None:
+            self._scroll = self._preview.query_one("#preview-scroll", VerticalScroll)
+        return self._scroll
 
     # --- Split preview ---
 
@@ -105,8 +142,8 @@ class NcviewApp(App):
         if self._preview_is_open():
             return
         self._split_view = not self._split_view
-        preview = self.query_one("#preview", PreviewPanel)
-        browser = self.query_one("#browser", FileBrowser)
+        preview = self._preview
+        browser = self._browser
         if self._split_view:
             browser.styles.width = "45%"
             preview.styles.display = "block"
@@ -114,14 +151,13 @@ class NcviewApp(App):
             # Load preview for currently highlighted file
             path = browser._get_highlighted_path()
             if path and path.is_file():
-                self._split_pending_path = path
-                self._debounce_split_preview()
+                self._schedule_split_preview(path)
         else:
             await preview.clear()
             browser.styles.width = "1fr"
             preview.styles.display = "none"
             preview.styles.width = "1fr"
-            browser.query_one("#file-list").focus()
+            browser._table.focus()
 
     @on(FileHighlighted)
     def _on_file_highlighted(self, event: FileHighlighted) -> None:
@@ -130,18 +166,73 @@ class NcviewApp(App):
             return
         if not event.path.is_file():
             return
-        self._split_pending_path = event.path
-        self._debounce_split_preview()
-
-    @work(exclusive=True, group="split-preview")
-    async def _debounce_split_preview(self) -> None:
-        """Load the split preview after a short debounce."""
-        import asyncio
-        await asyncio.sleep(0.1)
-        path = self._split_pending_path
-        if path and path.is_file() and self._split_view and not self._preview_is_open():
-            preview = self.query_one("#preview", PreviewPanel)
-            await preview.show_file(path)
+        self._schedule_split_preview(event.path)
+
+    def _prefetch(self, path: Path) -> None:
+        """Warm `path` while the debounce runs, reusing a running prefetch."""
+        self._prefetch_path = path
+        self._prefetch_wake.set()
+        if self._prefetch_worker is None or self._prefetch_worker.is_finished:
+            self._prefetch_worker = self._prefetch_preview()
+
+    @work(thread=True, group="prefetch")
+    def _prefetch_preview(self) -> None:
+        """Warm the preview for each new _prefetch_path.
+
+        Reads the file head into the OS page cache and resolves the viewer
+        class, which imports the viewer module and its heavy dependencies
+        (polars, pyarrow) off the UI thread. The thread stays up until the
+        cursor has been idle for a moment, so holding j/k uses one thread
+        rather than one per highlight. Best effort: a path set just as it
+        exits waits for the next highlight.
+        """
+        while self._prefetch_wake.wait(_PREFETCH_IDLE):
+            self._prefetch_wake.clear()
+            path = self._prefetch_path
+            try:
+                with open(path, "rb") as f:
+                    f.read(_PREFETCH_BYTES)
+            except OSError:
+                continue
+            registry.get_viewer(path).preload()
+
+    def _schedule_split_preview(self, path: Path) -> None:
+        """Load the split preview, debouncing only while the cursor is moving.
+
+        An isolated move after a pause renders immediately; rapid moves
+        (holding j/k) wait 100ms so only the final file is loaded. Restarting
+        one timer avoids spawning a worker per highlight event.
+        """
+        self._split_pending_path = path
+        if self._split_timer is not None:
+            self._split_timer.stop()
+        # Measured between highlights, not from the last render: a render
+        # stamp would let a held key through every half second
+        now = time.monotonic()
+        moving = now - self._last_highlight < _SPLIT_PAUSE
+        self._last_highlight = now
+        if moving:
+            self._prefetch(path)
+            self._split_timer = self.set_timer(0.1, self._do_split_preview)
+        else:
+            self._split_timer = None
+            self.call_later(self._do_split_preview)
+
+    async def _do_split_preview(self) -> None:
+        """Timer callback for _schedule_split_preview.
+
+        Serialized on _split_lock: show_file() awaits the old viewer's
+        removal and the new one's mount, and a second callback starting in
+        between would leave two viewers mounted. A callback that waited
+        reads the pending path afresh, so a queue of them loads only the
+        latest file.
+        """
+        async with self._split_lock:
+            path = self._split_pending_path
+            if path == self._preview.current_path:
+                return
+            if path and path.is_file() and self._split_view and not self._preview_is_open():
+                await self._preview.show_file(path)
 
     # --- Full-screen preview ---
 
@@ -150,8 +241,8 @@ class NcviewApp(App):
         """User pressed Enter/l on a file — show full-screen preview."""
         if not event.path.is_file():
             return
-        preview = self.query_one("#preview", PreviewPanel)
-        browser = self.query_one("#browser", FileBrowser)
+        preview = self._preview
+        browser = self._browser
 
         await preview.show_file(event.path)
         self._preview_path = event.path
@@ -161,10 +252,10 @@ class NcviewApp(App):
         preview.styles.display = "block"
         preview.styles.width = "1fr"
         preview.add_class("visible")
-        self.query_one("#status-bar", StatusBar).mode = "preview"
+        self._preview_open = True
+        self._status.mode = "preview"
 
         # Focus the right widget so vim keys work
-        from textual.widgets import DataTable
         from ncview.viewers.json_viewer import JsonTree
         try:
             dt = preview.query_one(DataTable)
@@ -174,14 +265,16 @@ class NcviewApp(App):
                 jt = preview.query_one(JsonTree)
                 jt.focus()
             except Exception:
-                preview.query_one("#preview-scroll", VerticalScroll).focus()
+                self._preview_scroll().focus()
 
     async def _close_preview(self) -> None:
         """Return from full-screen preview to browser (or split view)."""
-        preview = self.query_one("#preview", PreviewPanel)
-        browser = self.query_one("#browser", FileBrowser)
+        preview = self._preview
+        browser = self._browser
         self._preview_path = None
+        self._scroll = None
         preview.remove_class("visible")
+        self._preview_open = False
 
         if self._split_view:
             # Return to split layout
@@ -191,8 +284,7 @@ class NcviewApp(App):
             # Update preview for currently highlighted file
             path = browser._get_highlighted_path()
             if path and path.is_file():
-                self._split_pending_path = path
-                self._debounce_split_preview()
+                self._schedule_split_preview(path)
         else:
             # Return to browser-only
             await preview.clear()
@@ -201,8 +293,8 @@ class NcviewApp(App):
             preview.styles.display = "none"
             preview.styles.width = "1fr"
 
-        browser.query_one("#file-list").focus()
-        self.query_one("#status-bar", StatusBar).mode = "browser"
+        browser._table.focus()
+        self._status.mode = "browser"
 
     async def action_close_preview(self) -> None:
         if self._preview_is_open():
@@ -224,7 +316,7 @@ class NcviewApp(App):
             return
         from ncview.widgets.pins_screen import PinsScreen
 
-        browser = self.query_one("#browser", FileBrowser)
+        browser = self._browser
 
         def _on_pin_selected(path: Path | None) -> None:
             if path is not None:
@@ -242,75 +334,54 @@ class NcviewApp(App):
         if not ipython:
             self.notify("ipython not found on PATH", severity="error")
             return
-        browser = self.query_one("#browser", FileBrowser)
+        browser = self._browser
         with self.suspend():
             subprocess.call([ipython], cwd=str(browser.current_dir))
 
     def action_preview_scroll_down(self) -> None:
         if self._preview_is_open():
-            self.query_one("#preview-scroll", VerticalScroll).scroll_down()
+            self._preview_scroll().scroll_down()
 
     def action_preview_scroll_up(self) -> None:
         if self._preview_is_open():
-            self.query_one("#preview-scroll", VerticalScroll).scroll_up()
+            self._preview_scroll().scroll_up()
 
     def action_preview_page_down(self) -> None:
         if self._preview_is_open():
-            self.query_one("#preview-scroll", VerticalScroll).scroll_page_down()
+            self._preview_scroll().scroll_page_down()
 
     def action_preview_page_up(self) -> None:
         if self._preview_is_open():
-            self.query_one("#preview-scroll", VerticalScroll).scroll_page_up()
+            self._preview_scroll().scroll_page_up()
 
     def action_preview_scroll_top(self) -> None:
         if self._preview_is_open():
-            self.query_one("#preview-scroll", VerticalScroll).scroll_home()
+            self._preview_scroll().scroll_home()
 
     def action_preview_scroll_bottom(self) -> None:
         if self._preview_is_open():
-            self.query_one("#preview-scroll", VerticalScroll).scroll_end()
+            self._preview_scroll().scroll_end()
 
     async def action_preview_open_editor(self) -> None:
         if not self._preview_is_open() or self._preview_path is None:
             return
-        import os
-        import shlex
         import subprocess
-        editor = os.environ.get("EDITOR", "vim")
         with self.suspend():
-            subprocess.call([*shlex.split(editor), str(self._preview_path)])
+            subprocess.call([*editor_command(), str(self._preview_path)])
         await self._close_preview()
 
     def action_viewer_tab(self, tab_num: str) -> None:
         """Switch viewer tabs with 1/2/3 keys (parquet and CSV viewers)."""
         if not self._preview_is_open():
             return
-        from textual.widgets import TabbedContent, DataTable
-        # Find any viewer with tabbed content
-        preview = self.query_one("#preview", PreviewPanel)
-        try:
-            tc = preview.query_one(TabbedContent)
-        except Exception:
+        viewer = self._preview._current_viewer
+        if viewer is None or not viewer.TAB_IDS:
             return
-        # Map tab numbers to tab IDs — try parquet first, then CSV
-        pq_map = {"1": "data-tab", "2": "schema-tab", "3": "stats-tab"}
-        csv_map = {"1": "csv-data-tab", "2": "csv-schema-tab", "3": "csv-stats-tab"}
-        tab_id = pq_map.get(tab_num)
-        if tab_id:
-            try:
-                tc.active = tab_id
-            except Exception:
-                # Not a parquet viewer, try CSV tab IDs
-                tab_id = csv_map.get(tab_num)
-                if tab_id:
-                    try:
-                        tc.active = tab_id
-                    except Exception:
-                        return
+        viewer.query_one(TabbedContent).active = viewer.TAB_IDS[int(tab_num) - 1]
         # Refocus DataTable when switching to data tab
         if tab_num == "1":
             try:
-                preview.query_one(DataTable).focus()
+                viewer.query_one(DataTable).focus()
             except Exception:
                 pass
 
@@ -320,7 +391,7 @@ class NcviewApp(App):
             return
         from ncview.widgets.history_screen import HistoryScreen
 
-        browser = self.query_one("#browser", FileBrowser)
+        browser = self._browser
 
         def _on_selected(path: Path | None) -> None:
             if path is not None:
@@ -330,9 +401,36 @@ class NcviewApp(App):
 
     @on(DirectoryChanged)
     def _on_directory_changed(self, event: DirectoryChanged) -> None:
-        path_bar = self.query_one("#path-bar", PathBar)
-        path_bar.update_path(event.path)
-        add_to_history(str(event.path))
+        # Always: a reload after a shell command or file operation may have
+        # changed the branch or dirty state
+        self._path_bar.update_path(event.path)
+        # Reloads (sort, hidden toggle, mtime polling) re-post the same directory
+        if event.path == self._last_history_path:
+            return
+        self._last_history_path = event.path
+        self._pending_history_path = event.path
+        self._debounce_history_write()
+
+    @work(exclusive=True, group="history")
+    async def _debounce_history_write(self) -> None:
+        """Persist the latest directory after a short debounce.
+
+        Rapid navigation (holding h/l) collapses into a single history write.
+        """
+        await asyncio.sleep(0.3)
+        self._flush_history()
+
+    def _flush_history(self) -> None:
+        """Write the pending history entry, if any."""
+        path = self._pending_history_path
+        if path is not None:
+            self._pending_history_path = None
+            add_to_history(str(path))
+
+    def on_unmount(self) -> None:
+        # Navigating and quitting inside the debounce would otherwise lose
+        # the last directory
+        self._flush_history()
 
 
 def run(start: str = ".") -> None:
@@ -0,0 +1,134 @@
+"""macOS bulk directory listing via getattrlistbulk(2).
+
+scandir() on macOS still costs one getattrlist() per entry to learn size
+and mtime. getattrlistbulk() returns name, type, mode, size and mtime for
+a whole buffer of entries per syscall. Only importable on Darwin.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import stat
+import struct
+
+_libc = ctypes.CDLL(None, use_errno=True)
+_getattrlistbulk = _libc.getattrlistbulk
+
+# <sys/attr.h>
+_ATTR_BIT_MAP_COUNT = 5
+_ATTR_CMN_NAME = 0x00000001
+_ATTR_CMN_OBJTYPE = 0x00000008
+_ATTR_CMN_MODTIME = 0x00000400
+_ATTR_CMN_ACCESSMASK = 0x00020000
+_ATTR_CMN_ERROR = 0x20000000
+_ATTR_CMN_RETURNED_ATTRS = 0x80000000
+_ATTR_FILE_TOTALSIZE = 0x00000002
+
+# <sys/vnode.h> fsobj_type_t
+_VREG, _VDIR, _VLNK = 1, 2, 5
+_IFMT = {_VREG: stat.S_IFREG, _VDIR: stat.S_IFDIR, _VLNK: stat.S_IFLNK}
+
+_BUF_SIZE = 64 * 1024
+
+# Attributes are packed on 4-byte boundaries, so no native alignment
+_U32 = struct.Struct("=I")
+_RETURNED = struct.Struct("=5I")  # attribute_set_t
+_NAME_REF = struct.Struct("=iI")  # attrreference_t: offset, length
+_TIMESPEC = struct.Struct("=qq")
+_OFF_T = struct.Struct("=q")
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+_getattrlistbulk.argtypes = [
+    ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64,
+]
+_getattrlistbulk.restype = ctypes.c_int
+
+_ATTRS = _AttrList(
+    bitmapcount=_ATTR_BIT_MAP_COUNT,
+    commonattr=(
+        _ATTR_CMN_RETURNED_ATTRS | _ATTR_CMN_ERROR | _ATTR_CMN_NAME
+        | _ATTR_CMN_OBJTYPE | _ATTR_CMN_MODTIME | _ATTR_CMN_ACCESSMASK
+    ),
+    fileattr=_ATTR_FILE_TOTALSIZE,
+)
+
+
+def scan_dir(path: str) -> list[tuple[str, os.stat_result | None]]:
+    """List a directory as (name, stat) pairs without following symlinks.
+
+    The stat results carry only st_mode, st_size and st_mtime; everything
+    else is zero. Entries the kernel couldn't stat come back as None.
+    Raises OSError if the directory can't be read.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        buf = ctypes.create_string_buffer(_BUF_SIZE)
+        entries: list[tuple[str, os.stat_result | None]] = []
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(_ATTRS), buf, _BUF_SIZE, 0)
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), path)
+            if count == 0:
+                return entries
+            _parse(buf.raw, count, entries)
+    finally:
+        os.close(fd)
+
+
+def _parse(data: bytes, count: int, out: list[tuple[str, os.stat_result | None]]) -> None:
+    """Unpack `count` entries from a getattrlistbulk buffer (see its man page)."""
+    pos = 0
+    for _ in range(count):
+        (length,) = _U32.unpack_from(data, pos)
+        p = pos + 4
+        common, _vol, _dir, fileattr, _fork = _RETURNED.unpack_from(data, p)
+        p += _RETURNED.size
+        if common & _ATTR_CMN_ERROR:
+            (err,) = _U32.unpack_from(data, p)
+            p += 4
+        else:
+            err = 0
+        name = ""
+        if common & _ATTR_CMN_NAME:
+            offset, name_len = _NAME_REF.unpack_from(data, p)
+            start = p + offset
+            name = os.fsdecode(data[start:start + name_len - 1])  # drop the NUL
+            p += _NAME_REF.size
+        objtype = 0
+        if common & _ATTR_CMN_OBJTYPE:
+            (objtype,) = _U32.unpack_from(data, p)
+            p += 4
+        mtime = 0.0
+        if common & _ATTR_CMN_MODTIME:
+            sec, nsec = _TIMESPEC.unpack_from(data, p)
+            mtime = sec + nsec / 1e9
+            p += _TIMESPEC.size
+        perm = 0
+        if common & _ATTR_CMN_ACCESSMASK:
+            (perm,) = _U32.unpack_from(data, p)
+            p += 4
+        size = 0
+        if fileattr & _ATTR_FILE_TOTALSIZE:
+            (size,) = _OFF_T.unpack_from(data, p)
+        pos += length
+        if not name:
+            continue
+        if err:
+            out.append((name, None))
+            continue
+        mode = _IFMT.get(objtype, 0) | stat.S_IMODE(perm)
+        out.append((name, os.stat_result((mode, 0, 0, 0, 0, 0, size, 0, mtime, 0))))
@@ -7,24 +7,60 @@ import os
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
+
+# The environment is fixed for the life of the TUI, so check SSH once
+_IS_SSH = bool(os.environ.get("SSH_TTY") or os.environ.get("SSH_CLIENT"))
 
 
 def copy_to_clipboard(text: str) -> None:
     """Copy text to system clipboard.
 
-    Uses native clipboard tools (pbcopy/xclip/xsel) when running locally.
+    Uses the macOS pasteboard in-process when PyObjC is installed, else
+    native clipboard tools (pbcopy/xclip/xsel) when running locally.
     Falls back to OSC 52 escape sequence over SSH sessions.
     """
-    if not _is_ssh() and _try_native(text):
+    if not _IS_SSH and _try_appkit(text):
+        return
+    # Encoded once for both byte-level paths
+    data = text.encode()
+    if not _IS_SSH and _try_native(data):
         return
-    _osc52(text)
+    _osc52(data)
+
 
+@lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """shutil.which, memoized — PATH doesn't change while the app runs."""
+    return shutil.which(name)
 
-def _is_ssh() -> bool:
-    return bool(os.environ.get("SSH_TTY") or os.environ.get("SSH_CLIENT"))
+
+@lru_cache(maxsize=1)
+def _appkit_pasteboard():
+    """(general pasteboard, string type) from PyObjC, or None without it."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:  # optional speedup: pip install ncview[fast]
+        return None
+    return NSPasteboard.generalPasteboard(), NSPasteboardTypeString
 
 
-def _try_native(text: str) -> bool:
+def _try_appkit(text: str) -> bool:
+    """Set the macOS pasteboard directly — no pbcopy fork/exec per copy."""
+    board = _appkit_pasteboard()
+    if board is None:
+        return False
+    pasteboard, string_type = board
+    try:
+        pasteboard.clearContents()
+        return bool(pasteboard.setString_forType_(text, string_type))
+    except Exception:
+        return False
+
+
+def _try_native(data: bytes) -> bool:
     """Try native clipboard commands. Returns True on success."""
     for cmd in (
         ["pbcopy"],                              # macOS
@@ -33,23 +69,35 @@ def _try_native(text: str) -> bool:
         ["xsel", "--clipboard", "--input"],       # X11 alt
         ["clip.exe"],                            # WSL
     ):
-        if shutil.which(cmd[0]):
+        if _which(cmd[0]):
             try:
-                subprocess.run(cmd, input=text.encode(), check=True)
-                return True
-            except (subprocess.SubprocessError, OSError):
+                # Stream straight into the pipe rather than buffering via run(input=...)
+                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+            except OSError:
                 continue
+            try:
+                proc.stdin.write(data)
+                proc.stdin.close()
+                if proc.wait() == 0:
+                    return True
+            except OSError:
+                proc.kill()
+                proc.wait()
     return False
 
 
-def _osc52(text: str) -> None:
+def _osc52(data: bytes) -> None:
     """Send OSC 52 escape sequence — works over SSH if terminal supports it."""
-    encoded = base64.b64encode(text.encode()).decode()
-    payload = f"\033]52;c;{encoded}\a"
+    # Built as bytes end to end — no decode/re-encode copy of large payloads
+    payload = b"\033]52;c;" + base64.b64encode(data) + b"\a"
     try:
-        with open("/dev/tty", "w") as tty:
+        with open("/dev/tty", "wb", buffering=0) as tty:
             tty.write(payload)
-            tty.flush()
     except OSError:
-        sys.stderr.write(payload)
+        # Textual may swap sys.stderr for a text-only capture object
+        stream = getattr(sys.stderr, "buffer", None)
+        if stream is not None:
+            stream.write(payload)
+        else:
+            sys.stderr.write(payload.decode("ascii"))
         sys.stderr.flush()
@@ -1,8 +1,9 @@
-"""Centralized config directory resolution."""
+"""Centralized config resolution — config directory, editor command, and tunables."""
 
 from __future__ import annotations
 
 import os
+import shlex
 from functools import lru_cache
 from pathlib import Path
 
@@ -22,3 +23,22 @@ def config_dir() -> Path:
     if xdg:
         return Path(xdg) / "ncview"
     return Path.home() / ".config" / "ncview"
+
+
+@lru_cache(maxsize=1)
+def editor_command() -> tuple[str, ...]:
+    """Return $EDITOR split into argv (default: vim)."""
+    return tuple(shlex.split(os.environ.get("EDITOR", "vim")))
+
+
+@lru_cache(maxsize=1)
+def syntax_max_bytes() -> int:
+    """Return the largest text that gets syntax highlighting.
+
+    Set by $NCVIEW_SYNTAX_MAX_BYTES (default: 1 MB). Larger files are shown
+    with line numbers only.
+    """
+    try:
+        return int(os.environ["NCVIEW_SYNTAX_MAX_BYTES"])
+    except (KeyError, ValueError):
+        return 1024 * 1024
@@ -0,0 +1,100 @@
+"""Directory change notifications via watchdog (inotify / FSEvents / kqueue).
+
+With a directory watched, the browser can trust its cached scan until an
+event arrives instead of stat()ing the directory on every reload and poll.
+watchdog is optional; without it start_watcher() returns None and the
+browser keeps polling mtimes.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional speedup: pip install ncview[fast]
+    FileSystemEventHandler = object
+    Observer = None
+
+# Events that change which entries a listing has. Writes and closes are left
+# out: a tailed log or a build writing outputs would otherwise force a full
+# re-list and git status on every poll, just to refresh sizes
+_CHANGE_EVENTS = frozenset({"created", "deleted", "moved"})
+_MAX_WATCHES = 64
+
+
+class _Handler(FileSystemEventHandler):
+    def __init__(self, path: str, on_change: Callable[[str], None]) -> None:
+        super().__init__()
+        self._path = path
+        self._on_change = on_change
+
+    def on_any_event(self, event) -> None:
+        if event.event_type in _CHANGE_EVENTS:
+            self._on_change(self._path)
+
+
+class DirWatcher:
+    """Non-recursive watches on the most recently used directories.
+
+    on_change(path) runs on watchdog's thread after anything in `path`
+    changes, and also when its watch is dropped to stay under the limit —
+    from then on nothing would report a change, so it must be treated as
+    changed.
+    """
+
+    def __init__(self, on_change: Callable[[str], None]) -> None:
+        self._on_change = on_change
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._watches: OrderedDict[str, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def watch(self, path: str) -> bool:
+        """Watch `path` if it isn't already. True if it is now watched."""
+        evicted: list[str] = []
+        with self._lock:
+            if path in self._watches:
+                self._watches.move_to_end(path)
+                return True
+            try:
+                self._watches[path] = self._observer.schedule(
+                    _Handler(path, self._on_change), path, recursive=False,
+                )
+            except Exception:  # vanished or unreadable dir, inotify watch limit
+                return False
+            while len(self._watches) > _MAX_WATCHES:
+                old, handle = self._watches.popitem(last=False)
+                self._unschedule(handle)
+                evicted.append(old)
+        for old in evicted:
+            self._on_change(old)
+        return True
+
+    def watching(self, path: str) -> bool:
+        return path in self._watches
+
+    def stop(self) -> None:
+        # Not joined: the emitter threads are daemons and exit with the app
+        self._observer.stop()
+
+    def _unschedule(self, handle) -> None:
+        try:
+            self._observer.unschedule(handle)
+        except Exception:
+            pass
+
+
+def start_watcher(on_change: Callable[[str], None]) -> DirWatcher | None:
+    """A running DirWatcher, or None if watchdog is missing or won't start."""
+    if Observer is None:
+        return None
+    try:
+        watcher = DirWatcher(on_change)
+        watcher._observer.start()
+    except Exception:
+        return None
+    return watcher
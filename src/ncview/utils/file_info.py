@@ -4,29 +4,40 @@ from __future__ import annotations
 
 import os
 import stat
-from datetime import datetime, timezone
+import time
+from functools import lru_cache
 from pathlib import Path
 
 
-def human_size(size: int | float) -> str:
-    """Convert bytes to human-readable string."""
-    for unit in ("B", "K", "M", "G", "T"):
-        if abs(size) < 1024:
-            if unit == "B":
-                return f"{int(size)}{unit}"
-            return f"{size:.1f}{unit}"
-        size = size / 1024
-    return f"{size:.1f}P"
+_SIZE_UNITS = ("B", "K", "M", "G", "T", "P")
 
 
-def file_icon(path: Path, is_dir: bool | None = None) -> str:
-    """Return a Nerd Font icon for a path.
+@lru_cache(maxsize=4096)
+def human_size(size: int | float) -> str:
+    """Convert bytes to human-readable string.
 
-    Pass is_dir=True/False to avoid a stat() syscall.
+    Memoized: a directory reload (sort, hidden toggle, change poll) formats
+    mostly the same sizes again.
     """
-    if is_dir if is_dir is not None else path.is_dir():
+    size = int(size)
+    if size < 1024:
+        return f"{size}B"
+    # bit_length() - 1 is floor(log2), so // 10 is the 1024-power tier
+    tier = min((size.bit_length() - 1) // 10, 5)
+    return f"{size / (1 << (tier * 10)):.1f}{_SIZE_UNITS[tier]}"
+
+
+def file_icon_for_name(name: str, is_dir: bool) -> str:
+    """Return a Nerd Font icon from a bare file name — no path objects, no stat."""
+    if is_dir:
         return "\uf07b"  # nf-fa-folder
-    ext = path.suffix.lower()
+    dot = name.rfind(".")
+    return _icon_for_ext(name[dot:].lower() if dot > 0 else "")
+
+
+@lru_cache(maxsize=512)
+def _icon_for_ext(ext: str) -> str:
+    """Icon for a lowercased extension — a listing has only a few distinct ones."""
     icon = _ICON_MAP.get(ext)
     if icon:
         return icon
@@ -83,51 +94,61 @@ _ICON_MAP: dict[str, str] = {
 _CODE_EXTS = {".h", ".hpp", ".cs", ".swift", ".kt", ".scala", ".r", ".m", ".pl"}
 
 
+@lru_cache(maxsize=1024)
+def _uid_name(uid: int) -> str:
+    """Map a uid to a user name (cached — pwd lookups hit NSS every call)."""
+    try:
+        import pwd
+        return pwd.getpwuid(uid).pw_name
+    except (ImportError, KeyError, AttributeError):
+        return str(uid)
+
+
+@lru_cache(maxsize=1024)
+def _gid_name(gid: int) -> str:
+    """Map a gid to a group name (cached — grp lookups hit NSS every call)."""
+    try:
+        import grp
+        return grp.getgrgid(gid).gr_name
+    except (ImportError, KeyError, AttributeError):
+        return str(gid)
+
+
 def file_metadata(path: Path) -> dict[str, str]:
     """Extract metadata dict for display in fallback viewer."""
+    # The real location, symlinks followed — one resolve() per preview
     info: dict[str, str] = {
         "Name": path.name,
-        "Path": str(path.resolve()) if not path.is_symlink() else str(path),
+        "Path": str(path.resolve()),
     }
 
-    # Check for broken symlinks first (lstat doesn't follow the link)
-    if path.is_symlink():
-        try:
-            target = os.readlink(path)
-            info["Link target"] = target
-            if not path.exists():
-                info["Link status"] = "broken"
-                return info
-        except OSError:
-            info["Link target"] = "(unreadable)"
-            return info
-
+    # One lstat, plus a following stat only for symlinks
     try:
-        st = path.stat()
+        st = os.lstat(path)
     except OSError:
         info["error"] = "Cannot read file metadata"
         return info
 
+    if stat.S_ISLNK(st.st_mode):
+        try:
+            info["Link target"] = os.readlink(path)
+        except OSError:
+            info["Link target"] = "(unreadable)"
+            return info
+        try:
+            st = os.stat(path)
+        except OSError:
+            info["Link status"] = "broken"
+            return info
+
     info.update({
         "Size": human_size(st.st_size),
         "Size (bytes)": f"{st.st_size:,}",
-        "Modified": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
-            .astimezone().strftime("%Y-%m-%d %H:%M:%S"),
-        "Created": datetime.fromtimestamp(st.st_ctime, tz=timezone.utc)
-            .astimezone().strftime("%Y-%m-%d %H:%M:%S"),
+        "Modified": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st.st_mtime)),
+        "Created": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st.st_ctime)),
         "Permissions": stat.filemode(st.st_mode),
     })
 
-    try:
-        import pwd
-        info["Owner"] = pwd.getpwuid(st.st_uid).pw_name
-    except (ImportError, KeyError, AttributeError):
-        info["Owner"] = str(st.st_uid)
-
-    try:
-        import grp
-        info["Group"] = grp.getgrgid(st.st_gid).gr_name
-    except (ImportError, KeyError, AttributeError):
-        info["Group"] = str(st.st_gid)
-
+    info["Owner"] = _uid_name(st.st_uid)
+    info["Group"] = _gid_name(st.st_gid)
     return info
@@ -0,0 +1,47 @@
+"""File reads for viewers — mmap-backed for large files."""
+
+from __future__ import annotations
+
+import mmap
+import os
+from pathlib import Path
+
+# Below this, a plain read is as fast and skips the mmap setup
+MMAP_THRESHOLD = 1024 * 1024  # 1 MB
+
+
+def read_text(path: Path, size: int) -> str:
+    """Read a file as UTF-8, replacing undecodable bytes.
+
+    Files over MMAP_THRESHOLD are decoded straight from a read-only mmap,
+    so the raw bytes are never copied into an intermediate bytes object.
+    """
+    if size <= MMAP_THRESHOLD:
+        return path.read_text(encoding="utf-8", errors="replace")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return str(mm, "utf-8", "replace")
+
+
+def _head_lines(buf: bytes | mmap.mmap, max_lines: int) -> tuple[str, bool]:
+    pos = 0
+    for _ in range(max_lines):
+        nxt = buf.find(b"\n", pos)  # memchr, not a Python-level scan
+        if nxt < 0:
+            pos = len(buf)
+            break
+        pos = nxt + 1
+    return str(buf[:pos], "utf-8", "replace"), pos < len(buf)
+
+
+def read_head_lines(path: Path, max_lines: int) -> tuple[str, bool]:
+    """Decode only the first max_lines lines of a file as UTF-8.
+
+    Returns (text, truncated). Newlines are kept as they are in the file.
+    Bytes past the last returned line are never decoded, and for files
+    over MMAP_THRESHOLD never read either.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+            return _head_lines(f.read(), max_lines)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _head_lines(mm, max_lines)
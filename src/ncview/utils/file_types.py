@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import importlib
+from collections.abc import Set
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,34 +16,50 @@ class ViewerRegistry:
     """Maps file extensions to viewer widget classes."""
 
     def __init__(self) -> None:
-        self._viewers: list[type[BaseViewer]] = []
+        # ext -> (priority, viewer class or lazy "module:Class" import path).
+        # Resolved at register time so lookups are a single dict hit.
+        self._by_ext: dict[str, tuple[int, type[BaseViewer] | str]] = {}
+
+    def _add(self, extensions: Set[str], priority: int, target: type[BaseViewer] | str) -> None:
+        """Claim each extension unless a viewer with equal or higher priority has it."""
+        for ext in extensions:
+            current = self._by_ext.get(ext)
+            if current is None or priority > current[0]:
+                self._by_ext[ext] = (priority, target)
 
     def register(self, viewer_cls: type[BaseViewer]) -> type[BaseViewer]:
-        """Register a viewer class."""
-        self._viewers.append(viewer_cls)
+        """Register a viewer class. Registering the same class twice is a no-op."""
+        self._add(viewer_cls.supported_extensions(), viewer_cls.priority(), viewer_cls)
         return viewer_cls
 
-    def get_viewer(self, path: Path) -> type[BaseViewer]:
-        """Return the best viewer class for a given file path."""
-        ext = path.suffix.lower()
-        best: type[BaseViewer] | None = None
-        best_priority = float("-inf")
+    def register_lazy(self, extensions: Set[str], priority: int, loader: str) -> None:
+        """Register a viewer by import path ("module:Class") without importing it.
 
-        for viewer_cls in self._viewers:
-            if ext in viewer_cls.supported_extensions():
-                p = viewer_cls.priority()
-                if p > best_priority:
-                    best = viewer_cls
-                    best_priority = p
+        The module is imported the first time the viewer wins a lookup.
+        """
+        self._add(extensions, priority, loader)
 
-        if best is None:
-            if _is_likely_text(path):
-                from ncview.viewers.text_viewer import TextViewer
-                return TextViewer
-            from ncview.viewers.fallback_viewer import FallbackViewer
-            return FallbackViewer
+    def _load(self, loader: str) -> type[BaseViewer]:
+        """Import a lazily registered viewer and swap it in for its import path."""
+        module_name, _, attr = loader.partition(":")
+        viewer_cls = getattr(importlib.import_module(module_name), attr)
+        for ext, (priority, target) in self._by_ext.items():
+            if target == loader:
+                self._by_ext[ext] = (priority, viewer_cls)
+        return viewer_cls
+
+    def get_viewer(self, path: Path) -> type[BaseViewer]:
+        """Return the best viewer class for a given file path."""
+        entry = self._by_ext.get(path.suffix.lower())
+        if entry is not None:
+            target = entry[1]
+            return self._load(target) if isinstance(target, str) else target
 
-        return best
+        if _is_likely_text(path):
+            from ncview.viewers.text_viewer import TextViewer
+            return TextViewer
+        from ncview.viewers.fallback_viewer import FallbackViewer
+        return FallbackViewer
 
 
 # Common extensionless text files
@@ -55,9 +74,22 @@ def _is_likely_text(path: Path) -> bool:
     """Heuristic check for extensionless text files."""
     if path.name.lower() in _TEXT_FILENAMES:
         return True
-    # Peek at first 512 bytes for null bytes (binary indicator)
     try:
-        chunk = path.read_bytes()[:512]
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return False
+    return _peek_is_text(str(path), mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _peek_is_text(path: str, mtime_ns: int) -> bool:
+    """Peek at the first 512 bytes for null bytes (binary indicator).
+
+    mtime_ns is only part of the cache key, so edited files are re-peeked.
+    """
+    try:
+        with open(path, "rb") as f:
+            chunk = f.read(512)
         return b"\x00" not in chunk
     except OSError:
         return False
@@ -1,22 +1,27 @@
-"""Directory history tracking."""
+"""Directory history tracking — append-only JSONL log, compacted periodically."""
 
 from __future__ import annotations
 
 import json
+from collections import deque
 from pathlib import Path
 
 from ncview.utils.config import config_dir
 
-HISTORY_FILE = config_dir() / "history.json"
+HISTORY_FILE = config_dir() / "history.jsonl"
+_LEGACY_HISTORY_FILE = config_dir() / "history.json"
 MAX_HISTORY = 25
+# Appends allowed between compactions — bounds the log at ~4x MAX_HISTORY lines
+_COMPACT_EVERY = MAX_HISTORY * 3
 
+_appends_since_compact: int | None = None
+_dir_ensured = False
 
-def load_history() -> list[str]:
-    """Load recent directory paths, most recent first."""
-    if not HISTORY_FILE.exists():
-        return []
+
+def _load_legacy() -> list[str]:
+    """Read the pre-JSONL history.json (a JSON list, most recent first)."""
     try:
-        data = json.loads(HISTORY_FILE.read_text())
+        data = json.loads(_LEGACY_HISTORY_FILE.read_text())
         if isinstance(data, list):
             return [str(p) for p in data][:MAX_HISTORY]
     except (json.JSONDecodeError, OSError):
@@ -24,12 +29,51 @@ def load_history() -> list[str]:
     return []
 
 
+def load_history() -> list[str]:
+    """Load recent directory paths, most recent first."""
+    if not HISTORY_FILE.exists():
+        return _load_legacy() if _LEGACY_HISTORY_FILE.exists() else []
+    try:
+        with HISTORY_FILE.open() as f:
+            lines = deque(f, maxlen=MAX_HISTORY + _COMPACT_EVERY)
+    except OSError:
+        return []
+    history: list[str] = []
+    seen: set[str] = set()
+    for line in reversed(lines):
+        try:
+            path = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(path, str) and path not in seen:
+            seen.add(path)
+            history.append(path)
+            if len(history) >= MAX_HISTORY:
+                break
+    return history
+
+
+def _compact(latest: str) -> None:
+    """Rewrite the log as the deduplicated most-recent MAX_HISTORY entries."""
+    history = [p for p in load_history() if p != latest]
+    history.insert(0, latest)
+    lines = [json.dumps(p) + "\n" for p in reversed(history[:MAX_HISTORY])]
+    HISTORY_FILE.write_text("".join(lines))
+
+
 def add_to_history(path: str) -> None:
     """Add a directory path to the top of history, deduplicating."""
+    global _appends_since_compact, _dir_ensured
     resolved = str(Path(path).resolve())
-    history = load_history()
-    history = [p for p in history if p != resolved]
-    history.insert(0, resolved)
-    history = history[:MAX_HISTORY]
-    HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    HISTORY_FILE.write_text(json.dumps(history, indent=2) + "\n")
+    if not _dir_ensured:
+        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _dir_ensured = True
+    # Compact on the first write of a session (also migrates history.json),
+    # then every _COMPACT_EVERY appends
+    if _appends_since_compact is None or _appends_since_compact >= _COMPACT_EVERY:
+        _compact(resolved)
+        _appends_since_compact = 0
+        return
+    with HISTORY_FILE.open("a") as f:
+        f.write(json.dumps(resolved) + "\n")
+    _appends_since_compact += 1
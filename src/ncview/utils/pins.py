@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TypedDict
 
 from ncview.utils.config import config_dir
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install ncview[fast]
+    orjson = None
+
 PINS_FILE = config_dir() / "pins.json"
+# Older versions wrote a bare list of fully resolved paths; the current
+# format is {"version": PINS_VERSION, "pins": [...]} with normalized paths
+PINS_VERSION = 2
 
 
 class Pin(TypedDict):
@@ -16,49 +26,148 @@ class Pin(TypedDict):
     name: str
 
 
+# Last parsed pins, keyed on the file's (st_mtime_ns, st_size)
+_cache: tuple[tuple[int, int], list[Pin]] | None = None
+# Bytes of our last write, with the stat key the file had right after it
+_last_written: tuple[tuple[int, int], bytes] | None = None
+
+
+def _stat_key() -> tuple[int, int] | None:
+    try:
+        st = PINS_FILE.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_pins() -> list[Pin]:
-    """Read the pinned directories list. Returns empty list if file is missing."""
-    if not PINS_FILE.exists():
+    """Read the pinned directories list. Returns empty list if file is missing.
+
+    Parsed results are reused until pins.json changes on disk. A file in
+    the old bare-list format is migrated and rewritten on first read.
+    """
+    global _cache
+    key = _stat_key()
+    if key is None:
+        _cache = None
         return []
+    if _cache is not None and _cache[0] == key:
+        return list(_cache[1])
     try:
-        data = json.loads(PINS_FILE.read_text())
-        if isinstance(data, list):
-            pins: list[Pin] = []
-            for entry in data:
-                if isinstance(entry, dict) and "path" in entry:
-                    pins.append(Pin(path=entry["path"], name=entry.get("name", "")))
-                elif isinstance(entry, str):
-                    # Backwards compat: bare string -> unnamed pin
-                    pins.append(Pin(path=entry, name=""))
-            return pins
+        raw = PINS_FILE.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except (json.JSONDecodeError, OSError):
-        pass
+        return []
+    if isinstance(data, dict) and data.get("version") == PINS_VERSION:
+        pins = _parse_pins(data.get("pins"))
+        _cache = (key, pins)
+        return list(pins)
+    if isinstance(data, list):
+        pins = _migrate_legacy(_parse_pins(data))
+        try:
+            _save_pins(pins)
+        except OSError:  # read-only config dir: migrate again next time
+            pass
+        return list(pins)
     return []
 
 
+def _parse_pins(data) -> list[Pin]:
+    pins: list[Pin] = []
+    if not isinstance(data, list):
+        return pins
+    for entry in data:
+        if isinstance(entry, dict) and "path" in entry:
+            pins.append(Pin(path=entry["path"], name=entry.get("name", "")))
+        elif isinstance(entry, str):
+            # Backwards compat: bare string -> unnamed pin
+            pins.append(Pin(path=entry, name=""))
+    return pins
+
+
+def _migrate_legacy(pins: list[Pin]) -> list[Pin]:
+    """Re-key pins from a pre-versioned pins.json, once.
+
+    Those were stored fully resolved, which is still a valid normalized
+    path. The exception is the home directory: it is re-added on every
+    start under Path.home(), so a resolved home (e.g. /var/home/me behind a
+    /home symlink) is moved to that spelling instead of being duplicated.
+    """
+    home = str(Path.home())
+    resolved_home = str(Path.home().resolve())
+    by_path: dict[str, Pin] = {}
+    for pin in pins:
+        key = home if pin["path"] == resolved_home else pin["path"]
+        by_path.setdefault(key, Pin(path=key, name=pin["name"]))
+    return list(by_path.values())
+
+
 def _save_pins(pins: list[Pin]) -> None:
-    """Write the pinned directories list to disk."""
+    """Write the pinned directories list to disk.
+
+    Skipped when the serialized bytes match the last write and the file is
+    untouched since, so no-op saves leave pins.json (and its mtime) alone.
+    """
+    global _cache, _last_written
+    doc = {"version": PINS_VERSION, "pins": pins}
+    if orjson is not None:
+        data = orjson.dumps(doc, option=orjson.OPT_INDENT_2) + b"\n"
+    else:
+        data = (json.dumps(doc, indent=2) + "\n").encode()
+    if _last_written is not None and _last_written[1] == data and _last_written[0] == _stat_key():
+        return
     PINS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    PINS_FILE.write_text(json.dumps(pins, indent=2) + "\n")
+    # Write-then-rename so readers never see a half-written file
+    tmp = PINS_FILE.with_name(PINS_FILE.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, PINS_FILE)
+    key = _stat_key()
+    _cache = (key, list(pins)) if key is not None else None
+    _last_written = (key, data) if key is not None else None
+
+
+def normalize_pin_path(path: str) -> str:
+    """Absolute, normalized form under which a pin is stored.
+
+    Avoids resolve()'s lstat/readlink walk over every component — symlinked
+    directories are pinned as given, the way the browser shows them. A path
+    with ".." is resolved: folding "link/.." lexically would name a
+    different directory than the filesystem does.
+    """
+    if ".." in Path(path).parts:
+        return str(Path(path).resolve())
+    return os.path.normpath(os.path.abspath(path))
+
+
+def add_pins(entries: Iterable[tuple[str, str]]) -> list[bool]:
+    """Add or overwrite several (path, name) pins with one load and one save.
+
+    Returns, per entry, whether an existing pin was overwritten. Nothing is
+    written if every entry is already pinned under the same name.
+    """
+    by_path = {p["path"]: p for p in load_pins()}
+    overwritten: list[bool] = []
+    changed = False
+    for path, name in entries:
+        key = normalize_pin_path(path)
+        existing = by_path.get(key)
+        overwritten.append(existing is not None)
+        if existing is None or existing["name"] != name:
+            by_path[key] = Pin(path=key, name=name)
+            changed = True
+    if changed:
+        _save_pins(list(by_path.values()))
+    return overwritten
 
 
 def add_pin(path: str, name: str = "") -> bool:
     """Add or overwrite a pin. Returns True if an existing pin was overwritten."""
-    resolved = str(Path(path).resolve())
-    pins = load_pins()
-    for i, p in enumerate(pins):
-        if p["path"] == resolved:
-            pins[i] = Pin(path=resolved, name=name)
-            _save_pins(pins)
-            return True
-    pins.append(Pin(path=resolved, name=name))
-    _save_pins(pins)
-    return False
+    return add_pins([(path, name)])[0]
 
 
 def remove_pin(path: str) -> None:
     """Remove a path from the pinned list and save."""
-    resolved = str(Path(path).resolve())
-    pins = load_pins()
-    pins = [p for p in pins if p["path"] != resolved]
-    _save_pins(pins)
+    by_path = {p["path"]: p for p in load_pins()}
+    if by_path.pop(normalize_pin_path(path), None) is None:
+        return
+    _save_pins(list(by_path.values()))
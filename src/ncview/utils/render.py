@@ -0,0 +1,88 @@
+"""Off-thread pre-rendering of Rich renderables and table previews."""
+
+from __future__ import annotations
+
+from rich.console import Console, RenderableType
+from rich.table import Table as RichTable
+from rich.text import Text
+from textual import work
+from textual.widgets import DataTable, Static
+
+DATA_PREVIEW_ROWS = 1_000
+STATS_COL_WIDTH = 16  # approx. terminal cells per describe() column
+# "#" column labels, built once for every preview
+_ROW_INDEX = [str(i) for i in range(DATA_PREVIEW_ROWS)]
+
+
+def prerender(renderable: RenderableType, width: int) -> Text:
+    """Lay out a renderable at a fixed width and return it as styled Text.
+
+    Rich tables re-run their layout on every repaint; for wide schemas that
+    takes hundreds of milliseconds. Rendering once in a worker thread leaves
+    the UI thread only cropped lines to draw.
+    """
+    console = Console(width=width, color_system="truecolor", force_terminal=True)
+    with console.capture() as capture:
+        console.print(renderable)
+    return Text.from_ansi(capture.get(), no_wrap=True, overflow="crop")
+
+
+def preview_rows(df) -> list[tuple[str, ...]]:
+    """DataTable rows for the head of a Polars frame: the "#" label, then
+    every column as text. One vectorized cast, then whole columns zipped
+    into row tuples — no per-cell Python formatting."""
+    import polars as pl
+
+    str_df = df.select(pl.all().cast(pl.Utf8).fill_null("null"))
+    columns = [s.to_list() for s in str_df.get_columns()]
+    return list(zip(_ROW_INDEX[:str_df.height], *columns))
+
+
+class TabularPreview:
+    """Mixin for viewers with a Data tab and a prerendered Schema tab.
+
+    Set SCHEMA_CONTENT_ID to the id of the Static that shows the schema.
+    Workers hand over a finished table with
+    ``app.call_from_thread(self._set_schema_table, table)``; it is laid out
+    off the UI thread, and again whenever the width changes.
+    """
+
+    SCHEMA_CONTENT_ID = ""
+
+    _schema_table: RichTable | None = None
+    _schema_width = 0
+    _schema_gen = 0  # bumped per render; older renders are dropped
+
+    def on_resize(self) -> None:
+        if self._schema_table is not None and self.size.width != self._schema_width:
+            self._render_schema()
+
+    def _set_schema_table(self, table: RichTable) -> None:
+        # Always a new table: a render of the previous one may still be running
+        self._schema_table = table
+        self._render_schema()
+
+    def _render_schema(self) -> None:
+        """Lay out the current schema table off the UI thread at the current width."""
+        self._schema_gen += 1
+        self._schema_width = self.size.width
+        self._render_schema_worker(self._schema_gen, self._schema_table, self._schema_width)
+
+    @work(thread=True, exclusive=True, group="schema")
+    def _render_schema_worker(self, gen: int, table: RichTable, width: int) -> None:
+        # exclusive doesn't stop a thread that is already running, so a
+        # superseded render may still finish; _show_schema drops it
+        content = prerender(table, width) if width else table
+        self.app.call_from_thread(self._show_schema, gen, content)
+
+    def _show_schema(self, gen: int, content: RenderableType) -> None:
+        if gen == self._schema_gen:
+            self.query_one(f"#{self.SCHEMA_CONTENT_ID}", Static).update(content)
+
+    def _populate_preview(self, dt: DataTable, col_names: list[str], rows: list[tuple[str, ...]]) -> None:
+        """Columns and rows in one UI-thread hop, repainted once."""
+        with self.app.batch_update():
+            dt.add_column("#", key="__row__")
+            for col_name in col_names:
+                dt.add_column(col_name, key=col_name)
+            dt.add_rows(rows)
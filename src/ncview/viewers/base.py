@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Set
 from pathlib import Path
 
 from textual.widget import Widget
@@ -18,13 +19,16 @@ class BaseViewer(Widget):
     }
     """
 
+    # Tab pane IDs switched by the 1/2/3 keys (viewers built on TabbedContent)
+    TAB_IDS: tuple[str, ...] = ()
+
     def __init__(self, path: Path, **kwargs) -> None:
         super().__init__(**kwargs)
         self.path = path
 
     @staticmethod
     @abstractmethod
-    def supported_extensions() -> set[str]:
+    def supported_extensions() -> Set[str]:
         """Return set of supported file extensions (e.g. {'.txt', '.py'})."""
         ...
 
@@ -33,6 +37,10 @@ class BaseViewer(Widget):
         """Higher priority wins when multiple viewers match an extension."""
         return 0
 
+    @classmethod
+    def preload(cls) -> None:
+        """Import heavy dependencies ahead of time (called from a worker thread)."""
+
     @abstractmethod
     async def load_content(self) -> None:
         """Load file content. Called after mount."""
@@ -6,6 +6,7 @@ only loading the first N rows for the data preview and stats.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 from rich.table import Table as RichTable
@@ -14,14 +15,36 @@ from textual import on, work
 from textual.widgets import DataTable, Static, TabbedContent, TabPane
 
 from ncview.utils.file_info import human_size
+from ncview.utils.render import DATA_PREVIEW_ROWS, STATS_COL_WIDTH, TabularPreview, preview_rows
 from ncview.viewers.base import BaseViewer
 
-DATA_PREVIEW_ROWS = 1_000
 STATS_ROWS = 10_000
 MAX_FILE_SIZE = 500 * 1024 * 1024  # 500 MB
+_COUNT_CHUNK = 1024 * 1024
 
 
-class CsvViewer(BaseViewer):
+def _count_rows(path: Path, size: int) -> int | None:
+    """Data rows counted from newlines — no CSV parsing.
+
+    None when the file has quotes: a quoted field may hold newlines, so
+    only a real parse can count its rows.
+    """
+    if size == 0:
+        return 0
+    lines = 0
+    last = b""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_COUNT_CHUNK), b""):
+            if b'"' in chunk:
+                return None
+            lines += chunk.count(b"\n")
+            last = chunk
+    if not last.endswith(b"\n"):
+        lines += 1  # last line has no trailing newline
+    return max(lines - 1, 0)  # minus the header
+
+
+class CsvViewer(TabularPreview, BaseViewer):
     """Displays CSV/TSV files with Schema, Data, and Stats tabs."""
 
     DEFAULT_CSS = """
@@ -52,10 +75,16 @@ class CsvViewer(BaseViewer):
     }
     """
 
+    TAB_IDS = ("csv-data-tab", "csv-schema-tab", "csv-stats-tab")
+    SCHEMA_CONTENT_ID = "csv-schema-content"
+
     def __init__(self, path: Path, **kwargs) -> None:
         super().__init__(path, **kwargs)
         self._stats_loaded = False
         self._separator = "\t" if path.suffix.lower() in (".tsv", ".tab") else ","
+        # One lazy scan (schema inferred once) shared by the worker threads
+        self._lf = None
+        self._lf_lock = threading.Lock()
 
     @staticmethod
     def supported_extensions() -> set[str]:
@@ -65,6 +94,10 @@ class CsvViewer(BaseViewer):
     def priority() -> int:
         return 10  # Higher than TextViewer (-1)
 
+    @classmethod
+    def preload(cls) -> None:
+        import polars  # noqa: F401
+
     def compose(self):
         yield Static(id="csv-info")
         with TabbedContent("Data", "Schema", "Stats", initial="csv-data-tab"):
@@ -82,6 +115,20 @@ class CsvViewer(BaseViewer):
     async def load_content(self) -> None:
         self._load_data()
 
+    def _scan(self):
+        """Lazy CSV scan shared by the data and stats workers."""
+        with self._lf_lock:
+            if self._lf is None:
+                import polars as pl
+
+                self._lf = pl.scan_csv(
+                    self.path,
+                    separator=self._separator,
+                    infer_schema_length=10_000,
+                    ignore_errors=True,
+                )
+            return self._lf
+
     @on(TabbedContent.TabActivated)
     def _on_tab_activated(self, event: TabbedContent.TabActivated) -> None:
         if event.pane.id == "csv-stats-tab" and not self._stats_loaded:
@@ -94,7 +141,6 @@ class CsvViewer(BaseViewer):
         import polars as pl
 
         info_widget = self.query_one("#csv-info", Static)
-        schema_widget = self.query_one("#csv-schema-content", Static)
         dt = self.query_one("#csv-data-table", DataTable)
 
         try:
@@ -109,61 +155,45 @@ class CsvViewer(BaseViewer):
                 )
                 return
 
-            # Read full file to get row count, but only keep preview rows for display
-            lf = pl.scan_csv(
-                self.path,
-                separator=self._separator,
-                infer_schema_length=10_000,
-                ignore_errors=True,
-            )
+            lf = self._scan()
             # Get schema from lazy frame (no data read)
             schema = lf.collect_schema()
             col_names = schema.names()
             col_types = [str(schema[name]) for name in col_names]
-
-            # Count total rows (requires a scan)
-            num_rows = lf.select(pl.len()).collect().item()
             num_cols = len(col_names)
+            sep_label = "TSV" if self._separator == "\t" else "CSV"
 
             # --- Info bar ---
-            sep_label = "TSV" if self._separator == "\t" else "CSV"
-            info = Text()
-            info.append(f"{num_rows:,} rows", style="bold cyan")
-            info.append(f"  {num_cols} cols", style="dim")
-            info.append(f"  {human_size(file_size)}", style="dim")
-            info.append(f"  {sep_label}", style="dim")
-            self.app.call_from_thread(info_widget.update, info)
+            def _info(rows_label: str) -> Text:
+                info = Text()
+                info.append(rows_label, style="bold cyan")
+                info.append(f"  {num_cols} cols", style="dim")
+                info.append(f"  {human_size(file_size)}", style="dim")
+                info.append(f"  {sep_label}", style="dim")
+                return info
+
+            # --- Data tab ---
+            # Head rows first: they need only the first rows parsed, while
+            # the row count reads the whole file
+            df = lf.head(DATA_PREVIEW_ROWS).collect()
+            self.app.call_from_thread(self._populate_preview, dt, col_names, preview_rows(df))
+
+            num_rows = _count_rows(self.path, file_size)
+            if num_rows is None:
+                self.app.call_from_thread(info_widget.update, _info("counting rows..."))
+                num_rows = lf.select(pl.len()).collect().item()
+            self.app.call_from_thread(info_widget.update, _info(f"{num_rows:,} rows"))
 
             # --- Schema tab ---
+            # Built once the row count is final, so it is prerendered once
             table = RichTable(title=f"{sep_label} Schema", expand=True)
             table.add_column("#", style="dim", width=4)
             table.add_column("Column", style="bold cyan")
             table.add_column("Type", style="green")
-
             for i, (name, dtype) in enumerate(zip(col_names, col_types)):
                 table.add_row(str(i), name, dtype)
-
             table.caption = f"Total rows: {num_rows:,}  |  File size: {human_size(file_size)}"
-            self.app.call_from_thread(schema_widget.update, table)
-
-            # --- Data tab ---
-            df = lf.head(DATA_PREVIEW_ROWS).collect()
-
-            def _add_columns():
-                dt.add_column("#", key="__row__")
-                for col_name in col_names:
-                    dt.add_column(col_name, key=col_name)
-
-            self.app.call_from_thread(_add_columns)
-
-            str_df = df.cast({col: pl.Utf8 for col in df.columns}).fill_null("null")
-            raw_rows = str_df.rows()
-            rows = [tuple([str(i)] + list(r)) for i, r in enumerate(raw_rows)]
-
-            def _add_rows():
-                dt.add_rows(rows)
-
-            self.app.call_from_thread(_add_rows)
+            self.app.call_from_thread(self._set_schema_table, table)
 
         except Exception as e:
             self.app.call_from_thread(
@@ -182,12 +212,12 @@ class CsvViewer(BaseViewer):
                 widget.update, Text("Computing statistics...", style="italic dim")
             )
 
-            df = pl.scan_csv(
-                self.path,
-                separator=self._separator,
-                infer_schema_length=10_000,
-                ignore_errors=True,
-            ).head(STATS_ROWS).collect()
+            # Only columns that fit on screen — describe() cost is per column,
+            # and the projection lets the CSV reader skip parsing the rest
+            lf = self._scan()
+            all_cols = lf.collect_schema().names()
+            shown = all_cols[:max(4, self.size.width // STATS_COL_WIDTH)]
+            df = lf.select(shown).head(STATS_ROWS).collect()
 
             desc = df.describe()
 
@@ -195,15 +225,15 @@ class CsvViewer(BaseViewer):
                 title=f"Statistics (first {min(STATS_ROWS, len(df)):,} rows)",
                 expand=True,
             )
+            if len(shown) < len(all_cols):
+                table.caption = f"Showing first {len(shown)} of {len(all_cols)} columns"
             for col_name in desc.columns:
                 style = "bold cyan" if col_name == "statistic" else "white"
                 table.add_column(col_name, style=style)
 
-            for i in range(len(desc)):
-                row = [
-                    str(desc[col][i]) if desc[col][i] is not None else ""
-                    for col in desc.columns
-                ]
+            # Stringify the whole frame in one vectorized cast
+            str_desc = desc.select(pl.all().cast(pl.Utf8).fill_null(""))
+            for row in str_desc.iter_rows():
                 table.add_row(*row)
 
             self.app.call_from_thread(widget.update, table)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from rich.table import Table
@@ -11,6 +13,25 @@ from ncview.utils.file_info import file_metadata
 from ncview.viewers.base import BaseViewer
 
 
+def _build_table(path: Path) -> Table:
+    table = Table(title="File Info", show_header=False, expand=True)
+    table.add_column("Key", style="bold cyan", ratio=1)
+    table.add_column("Value", ratio=3)
+    for key, value in file_metadata(path).items():
+        table.add_row(key, value)
+    return table
+
+
+@lru_cache(maxsize=256)
+def _cached_table(path: str, mtime_ns: int, ctime_ns: int, size: int) -> Table:
+    """Metadata table for a file, reused until it changes.
+
+    The stat fields are only part of the cache key: ctime catches
+    chmod/chown, mtime and size catch content changes.
+    """
+    return _build_table(Path(path))
+
+
 class FallbackViewer(BaseViewer):
     """Shows file metadata when no specialized viewer matches."""
 
@@ -33,10 +54,11 @@ class FallbackViewer(BaseViewer):
         yield Static(id="fallback-content")
 
     async def load_content(self) -> None:
-        meta = file_metadata(self.path)
-        table = Table(title="File Info", show_header=False, expand=True)
-        table.add_column("Key", style="bold cyan", ratio=1)
-        table.add_column("Value", ratio=3)
-        for key, value in meta.items():
-            table.add_row(key, value)
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            # Broken symlink or vanished file — nothing stable to key on
+            table = _build_table(self.path)
+        else:
+            table = _cached_table(str(self.path), st.st_mtime_ns, st.st_ctime_ns, st.st_size)
         self.query_one("#fallback-content", Static).update(table)
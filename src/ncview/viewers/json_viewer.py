@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import mmap
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 
 from textual import work
@@ -11,11 +14,68 @@ from rich.text import Text
 from textual.binding import Binding
 from textual.widgets import Static, Tree
 
+from ncview.utils.file_read import read_text
 from ncview.viewers.base import BaseViewer
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install ncview[fast]
+    orjson = None
+
 MAX_DEPTH = 50
 MAX_NODES = 50_000
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
+MAX_FILE_SIZE_FAST = 200 * 1024 * 1024  # 200 MB, orjson parsing from an mmap
+
+# List-index labels, shared instead of str(i) per element
+_INDEX_KEYS = [str(i) for i in range(4096)]
+
+
+def index_keys(n: int) -> list[str]:
+    """Labels "0" .. str(n - 1) for list elements."""
+    if n <= len(_INDEX_KEYS):
+        return _INDEX_KEYS[:n]
+    return _INDEX_KEYS + [str(i) for i in range(len(_INDEX_KEYS), n)]
+
+
+def _loads(buf: bytes | memoryview):
+    """Parse one JSON value from UTF-8 bytes.
+
+    Uses orjson when installed. Anything it rejects that stdlib json accepts
+    (NaN, integers over 64 bits, invalid UTF-8) is retried with json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(bytes(buf).decode("utf-8", "replace"))
+
+
+def _load_json(path: Path, size: int):
+    """Parse a JSON document — with orjson, directly from a read-only mmap."""
+    if orjson is None or size == 0:
+        return json.loads(read_text(path, size))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as buf:
+            return _loads(buf)
+
+
+def _load_jsonl(path: Path) -> tuple[list, bool]:
+    """Parse a JSON Lines file one line at a time, without decoding it whole.
+
+    Every record is at least one tree node, so reading stops after MAX_NODES
+    records. Returns (records, truncated).
+    """
+    records: list = []
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if len(records) >= MAX_NODES:
+                return records, True
+            records.append(_loads(line))
+    return records, False
 
 
 class JsonTree(Tree):
@@ -32,6 +92,28 @@ class JsonTree(Tree):
         Binding("G", "scroll_end", "Bottom", priority=True),
     ]
 
+    _batch_depth = 0
+
+    @contextmanager
+    def batch_add(self):
+        """Add many nodes with one cache invalidation and one repaint.
+
+        Tree invalidates its line cache and schedules a layout refresh on
+        every add; inside this block that happens once, on exit.
+        """
+        self._batch_depth += 1
+        try:
+            with self.app.batch_update():
+                yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._invalidate()
+
+    def _invalidate(self) -> None:
+        if not self._batch_depth:
+            super()._invalidate()
+
     def action_expand_node(self) -> None:
         """Expand current node, or move into first child if already expanded."""
         node = self.cursor_node
@@ -79,6 +161,7 @@ class JsonViewer(BaseViewer):
     def __init__(self, path: Path, **kwargs) -> None:
         super().__init__(path, **kwargs)
         self._node_count = 0
+        self._truncated = False
 
     @staticmethod
     def supported_extensions() -> set[str]:
@@ -100,19 +183,19 @@ class JsonViewer(BaseViewer):
         """Parse JSON in a background thread to keep UI responsive for large files."""
         try:
             file_size = self.path.stat().st_size
-            if file_size > MAX_FILE_SIZE:
-                self.app.call_from_thread(
-                    self._show_error,
-                    f"File too large ({file_size / 1024 / 1024:.1f} MB > {MAX_FILE_SIZE // 1024 // 1024} MB limit)",
-                )
+            # JSON Lines is streamed and stops at MAX_NODES, so any size is fine
+            is_jsonl = self.path.suffix.lower() == ".jsonl"
+            limit = MAX_FILE_SIZE_FAST if orjson is not None else MAX_FILE_SIZE
+            if not is_jsonl and file_size > limit:
+                message = f"File too large ({file_size / 1024 / 1024:.1f} MB > {limit // 1024 // 1024} MB limit)"
+                if orjson is None and file_size <= MAX_FILE_SIZE_FAST:
+                    message += " — install ncview[fast] to open it"
+                self.app.call_from_thread(self._show_error, message)
                 return
-            raw = self.path.read_text(errors="replace")
-
-            if self.path.suffix.lower() == ".jsonl":
-                lines = [json.loads(line) for line in raw.strip().split("\n") if line.strip()]
-                data = lines
+            if is_jsonl:
+                data, self._truncated = _load_jsonl(self.path)
             else:
-                data = json.loads(raw)
+                data = _load_json(self.path, file_size)
         except json.JSONDecodeError as e:
             self.app.call_from_thread(self._show_error, f"Invalid JSON: {e}")
             return
@@ -120,17 +203,16 @@ class JsonViewer(BaseViewer):
             self.app.call_from_thread(self._show_error, f"Error: {e}")
             return
 
-        self.app.call_from_thread(self._populate_tree, data)
+        self.app.call_from_thread(self._populate_tree, data, file_size)
 
     def _show_error(self, message: str) -> None:
         tree = self.query_one("#json-tree", JsonTree)
         tree.root.set_label(Text(message, style="bold red"))
 
-    def _populate_tree(self, data) -> None:
+    def _populate_tree(self, data, size: int) -> None:
         tree = self.query_one("#json-tree", JsonTree)
         info = self.query_one("#json-info", Static)
 
-        size = self.path.stat().st_size
         size_str = f"{size / 1024 / 1024:.1f} MB" if size >= 1024 * 1024 else f"{size / 1024:.1f} KB"
         info_text = Text()
         info_text.append(self.path.name, style="bold")
@@ -140,7 +222,8 @@ class JsonViewer(BaseViewer):
 
         tree.root.set_label(Text(self._describe_type(data), style="bold"))
         self._node_count = 0
-        self._build_tree(tree.root, data)
+        with tree.batch_add():
+            self._build_tree(tree.root, data)
         tree.root.expand()
         tree.focus()
 
@@ -148,31 +231,48 @@ class JsonViewer(BaseViewer):
         if isinstance(data, dict):
             return f"{self.path.name}  {{}} {len(data)} keys"
         elif isinstance(data, list):
-            return f"{self.path.name}  [] {len(data)} items"
+            more = "+" if self._truncated else ""
+            return f"{self.path.name}  [] {len(data)}{more} items"
         return self.path.name
 
     def _build_tree(self, node, data, key: str | None = None, depth: int = 0) -> None:
-        """Recursively build tree nodes from JSON data."""
-        if self._node_count >= MAX_NODES:
-            node.add_leaf(Text(f"... truncated ({MAX_NODES:,} node limit)", style="italic dim"))
-            return
-        if depth >= MAX_DEPTH:
-            node.add_leaf(Text(f"... depth limit ({MAX_DEPTH})", style="italic dim"))
-            return
-        self._node_count += 1
-        if isinstance(data, dict):
-            label = self._make_label(key, f"{{}} {len(data)} keys")
-            branch = node.add(label)
-            for k, v in data.items():
-                self._build_tree(branch, v, key=k, depth=depth + 1)
-        elif isinstance(data, list):
-            label = self._make_label(key, f"[] {len(data)} items")
-            branch = node.add(label)
-            for i, item in enumerate(data):
-                self._build_tree(branch, item, key=str(i), depth=depth + 1)
-        else:
-            label = self._format_value(key, data)
-            node.add_leaf(label)
+        """Build tree nodes from JSON data.
+
+        Walks depth-first with an explicit stack rather than recursing, so
+        deep or wide documents don't pay a Python frame per node. Once
+        MAX_NODES is reached each parent gets a single truncation marker.
+        """
+        make_label = self._make_label
+        format_value = self._format_value
+        count = self._node_count
+        truncated: set = set()
+        stack = [(node, data, key, depth)]
+        while stack:
+            parent, value, k, d = stack.pop()
+            if count >= MAX_NODES:
+                if parent.id not in truncated:
+                    truncated.add(parent.id)
+                    parent.add_leaf(Text(f"... truncated ({MAX_NODES:,} node limit)", style="italic dim"))
+                continue
+            if d >= MAX_DEPTH:
+                parent.add_leaf(Text(f"... depth limit ({MAX_DEPTH})", style="italic dim"))
+                continue
+            count += 1
+            kind = type(value)
+            if kind is dict:
+                branch = parent.add(make_label(k, f"{{}} {len(value)} keys"))
+                # Children past the remaining budget would only be truncated;
+                # one extra is kept so the marker still appears
+                items = list(islice(value.items(), MAX_NODES - count + 1))
+                stack.extend((branch, v, ck, d + 1) for ck, v in reversed(items))
+            elif kind is list:
+                branch = parent.add(make_label(k, f"[] {len(value)} items"))
+                n = min(len(value), MAX_NODES - count + 1)
+                keys = index_keys(n)
+                stack.extend((branch, value[i], keys[i], d + 1) for i in range(n - 1, -1, -1))
+            else:
+                parent.add_leaf(format_value(k, value))
+        self._node_count = count
 
     def _make_label(self, key: str | None, type_info: str) -> Text:
         text = Text()
@@ -187,14 +287,36 @@ class JsonViewer(BaseViewer):
         if key is not None:
             text.append(key, style="bold white")
             text.append(": ", style="dim")
-        if isinstance(value, str):
-            text.append(f'"{value}"', style="green")
-        elif isinstance(value, bool):
-            text.append(str(value).lower(), style="yellow")
-        elif isinstance(value, (int, float)):
-            text.append(str(value), style="cyan")
-        elif value is None:
-            text.append("null", style="dim italic")
-        else:
-            text.append(repr(value), style="white")
+        _VALUE_FORMATTERS.get(type(value), _append_repr)(text, value)
         return text
+
+
+# Parsed JSON only yields these exact types, so dispatch on type() instead of
+# an isinstance chain (which also had to test bool before int)
+def _append_str(text: Text, value: str) -> None:
+    text.append(f'"{value}"', style="green")
+
+
+def _append_bool(text: Text, value: bool) -> None:
+    text.append("true" if value else "false", style="yellow")
+
+
+def _append_number(text: Text, value: int | float) -> None:
+    text.append(str(value), style="cyan")
+
+
+def _append_null(text: Text, value: None) -> None:
+    text.append("null", style="dim italic")
+
+
+def _append_repr(text: Text, value) -> None:
+    text.append(repr(value), style="white")
+
+
+_VALUE_FORMATTERS = {
+    str: _append_str,
+    bool: _append_bool,
+    int: _append_number,
+    float: _append_number,
+    type(None): _append_null,
+}
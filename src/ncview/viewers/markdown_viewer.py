@@ -7,6 +7,7 @@ from rich.text import Text
 from textual import work
 from textual.widgets import Static
 
+from ncview.utils.file_read import read_text
 from ncview.viewers.base import BaseViewer
 
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
@@ -52,7 +53,7 @@ class MarkdownViewer(BaseViewer):
                     ),
                 )
                 return
-            raw = self.path.read_text(errors="replace")
+            raw = read_text(self.path, file_size)
             content = Markdown(raw)
             self.app.call_from_thread(self._show_content, content)
         except Exception as e:
@@ -2,13 +2,14 @@
 
 Designed to handle very large files (50GB+):
 - Schema and row count read from parquet footer metadata via pyarrow (O(1))
-- Data preview uses Polars lazy scan with .head() pushdown (reads minimal row groups)
-- Stats computed lazily on first tab visit, also with .head() pushdown
+- Data preview streams record batches from the same ParquetFile (reads minimal row groups)
+- Stats computed lazily on first tab visit, from the same ParquetFile
 - All I/O runs in thread workers to keep the UI responsive
 """
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 from rich.table import Table as RichTable
@@ -17,13 +18,13 @@ from textual import on, work
 from textual.widgets import DataTable, Static, TabbedContent, TabPane
 
 from ncview.utils.file_info import human_size
+from ncview.utils.render import DATA_PREVIEW_ROWS, STATS_COL_WIDTH, TabularPreview, preview_rows
 from ncview.viewers.base import BaseViewer
 
-DATA_PREVIEW_ROWS = 1_000
 STATS_ROWS = 10_000
 
 
-class ParquetViewer(BaseViewer):
+class ParquetViewer(TabularPreview, BaseViewer):
     """Displays parquet files with Schema, Data, and Stats tabs."""
 
     DEFAULT_CSS = """
@@ -54,6 +55,9 @@ class ParquetViewer(BaseViewer):
     }
     """
 
+    TAB_IDS = ("data-tab", "schema-tab", "stats-tab")
+    SCHEMA_CONTENT_ID = "schema-content"
+
     @staticmethod
     def supported_extensions() -> set[str]:
         return {".parquet"}
@@ -65,6 +69,14 @@ class ParquetViewer(BaseViewer):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._stats_loaded = False
+        # One ParquetFile (footer parsed once) shared by the worker threads
+        self._pf = None
+        self._pf_lock = threading.Lock()
+
+    @classmethod
+    def preload(cls) -> None:
+        import polars  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
 
     def compose(self):
         yield Static(id="pq-info")
@@ -80,6 +92,34 @@ class ParquetViewer(BaseViewer):
         self._load_metadata()
         self._load_data()
 
+    def _parquet_file(self):
+        """Open the file and parse its footer once. Call with _pf_lock held."""
+        if self._pf is None:
+            import pyarrow.parquet as pq
+
+            self._pf = pq.ParquetFile(self.path)
+        return self._pf
+
+    def _read_head(self, num_rows: int, columns: list[str] | None = None):
+        """First num_rows rows as a Polars frame, reading only the batches needed."""
+        import polars as pl
+        import pyarrow as pa
+
+        with self._pf_lock:
+            pf = self._parquet_file()
+            schema = pf.schema_arrow
+            if columns is not None:
+                schema = pa.schema([schema.field(name) for name in columns])
+            batches = []
+            num_read = 0
+            for batch in pf.iter_batches(batch_size=num_rows, columns=columns):
+                batches.append(batch)
+                num_read += batch.num_rows
+                if num_read >= num_rows:
+                    break
+            table = pa.Table.from_batches(batches, schema=schema)
+        return pl.from_arrow(table.slice(0, num_rows))
+
     @on(TabbedContent.TabActivated)
     def _on_tab_activated(self, event: TabbedContent.TabActivated) -> None:
         if event.pane.id == "stats-tab" and not self._stats_loaded:
@@ -89,14 +129,12 @@ class ParquetViewer(BaseViewer):
     @work(thread=True)
     def _load_metadata(self) -> None:
         """Read schema and row count from parquet footer (O(1), no data scan)."""
-        import pyarrow.parquet as pq
-
         info_widget = self.query_one("#pq-info", Static)
-        schema_widget = self.query_one("#schema-content", Static)
         try:
-            pf = pq.ParquetFile(self.path)
-            metadata = pf.metadata
-            arrow_schema = pf.schema_arrow
+            with self._pf_lock:
+                pf = self._parquet_file()
+                metadata = pf.metadata
+                arrow_schema = pf.schema_arrow
 
             num_rows = metadata.num_rows
             num_cols = metadata.num_columns
@@ -122,35 +160,18 @@ class ParquetViewer(BaseViewer):
                 table.add_row(str(i), field.name, str(field.type))
 
             table.caption = f"Total rows: {num_rows:,}  |  Row groups: {num_row_groups}  |  File size: {human_size(file_size)}"
-            self.app.call_from_thread(schema_widget.update, table)
+            self.app.call_from_thread(self._set_schema_table, table)
 
         except Exception as e:
             self.app.call_from_thread(info_widget.update, Text(f"Error reading metadata: {e}", style="bold red"))
 
     @work(thread=True)
     def _load_data(self) -> None:
-        """Load first N rows via lazy scan with predicate pushdown."""
-        import polars as pl
-
+        """Load the first N rows, reading only the record batches needed."""
         dt = self.query_one("#data-table", DataTable)
         try:
-            df = pl.scan_parquet(self.path).head(DATA_PREVIEW_ROWS).collect()
-
-            def _add_columns():
-                dt.add_column("#", key="__row__")
-                for col_name in df.columns:
-                    dt.add_column(col_name, key=col_name)
-
-            self.app.call_from_thread(_add_columns)
-
-            str_df = df.cast({col: pl.Utf8 for col in df.columns}).fill_null("null")
-            raw_rows = str_df.rows()
-            rows = [tuple([str(i)] + list(r)) for i, r in enumerate(raw_rows)]
-
-            def _add_rows():
-                dt.add_rows(rows)
-
-            self.app.call_from_thread(_add_rows)
+            df = self._read_head(DATA_PREVIEW_ROWS)
+            self.app.call_from_thread(self._populate_preview, dt, df.columns, preview_rows(df))
         except Exception as e:
             self.app.call_from_thread(
                 dt.add_column, f"Error: {e}", key="error"
@@ -165,16 +186,23 @@ class ParquetViewer(BaseViewer):
         try:
             self.app.call_from_thread(widget.update, Text("Computing statistics...", style="italic dim"))
 
-            df = pl.scan_parquet(self.path).head(STATS_ROWS).collect()
+            # Only columns that fit on screen — describe() cost is per column
+            with self._pf_lock:
+                all_cols = self._parquet_file().schema_arrow.names
+            shown = all_cols[:max(4, self.size.width // STATS_COL_WIDTH)]
+            df = self._read_head(STATS_ROWS, columns=shown)
             desc = df.describe()
 
             table = RichTable(title=f"Statistics (first {STATS_ROWS:,} rows)", expand=True)
+            if len(shown) < len(all_cols):
+                table.caption = f"Showing first {len(shown)} of {len(all_cols)} columns"
             for col_name in desc.columns:
                 style = "bold cyan" if col_name == "statistic" else "white"
                 table.add_column(col_name, style=style)
 
-            for i in range(len(desc)):
-                row = [str(desc[col][i]) if desc[col][i] is not None else "" for col in desc.columns]
+            # Stringify the whole frame in one vectorized cast
+            str_desc = desc.select(pl.all().cast(pl.Utf8).fill_null(""))
+            for row in str_desc.iter_rows():
                 table.add_row(*row)
 
             self.app.call_from_thread(widget.update, table)
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
+from rich.console import RenderableType
 from rich.syntax import Syntax
 from rich.text import Text
 from textual import work
 from textual.widgets import Static
 
+from ncview.utils.config import syntax_max_bytes
+from ncview.utils.file_read import read_head_lines
+from ncview.utils.render import prerender
 from ncview.viewers.base import BaseViewer
 
 MAX_LINES = 10_000
@@ -70,11 +75,52 @@ _EXT_TO_LEXER: dict[str, str] = {
     ".gql": "graphql",
 }
 
-# All extensions this viewer handles
-_ALL_EXTENSIONS = {
+# All extensions this viewer handles (immutable — handed out as-is)
+_ALL_EXTENSIONS: frozenset[str] = frozenset({
     ".txt", ".log", ".env", ".gitignore", ".dockerignore",
     ".editorconfig", ".properties", ".lock",
-} | set(_EXT_TO_LEXER.keys())
+} | _EXT_TO_LEXER.keys())
+
+
+def _read_capped(path: Path) -> str:
+    """Read a text file, truncated to MAX_LINES."""
+    raw, truncated = read_head_lines(path, MAX_LINES)
+    if "\r" in raw:
+        raw = raw.replace("\r\n", "\n")
+    if truncated:
+        raw = raw.removesuffix("\n") + f"\n\n... truncated at {MAX_LINES:,} lines ..."
+    return raw
+
+
+def _numbered(raw: str) -> Text:
+    """Plain text with a line-number gutter, for files too big to lex."""
+    lines = raw.split("\n")
+    pad = len(str(len(lines)))
+    text = Text(no_wrap=True, overflow="crop")
+    for i, line in enumerate(lines, 1):
+        if i > 1:
+            text.append("\n")
+        text.append(f"{i:>{pad}} ", style="dim")
+        text.append(line)
+    return text
+
+
+def _render(raw: str, lexer: str, width: int) -> RenderableType:
+    # Pygments is pure-Python regex work, linear in the text size
+    if len(raw) > syntax_max_bytes():
+        return _numbered(raw)
+    syntax = Syntax(raw, lexer, theme="monokai", line_numbers=True, word_wrap=False)
+    return prerender(syntax, width) if width else syntax
+
+
+@lru_cache(maxsize=16)
+def _highlighted(path: str, mtime_ns: int, size: int, lexer: str, width: int) -> RenderableType:
+    """Syntax-highlighted file laid out at a fixed width.
+
+    Pygments lexing happens here, in the worker, instead of on every repaint.
+    The stat fields only key the cache, so reopening an unchanged file is free.
+    """
+    return _render(_read_capped(Path(path)), lexer, width)
 
 
 class TextViewer(BaseViewer):
@@ -89,8 +135,13 @@ class TextViewer(BaseViewer):
     }
     """
 
+    def __init__(self, path: Path, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self._lexer = _EXT_TO_LEXER.get(path.suffix.lower())
+        self._rendered_width = 0
+
     @staticmethod
-    def supported_extensions() -> set[str]:
+    def supported_extensions() -> frozenset[str]:
         return _ALL_EXTENSIONS
 
     @staticmethod
@@ -103,11 +154,17 @@ class TextViewer(BaseViewer):
     async def load_content(self) -> None:
         self._load_text()
 
+    def on_resize(self) -> None:
+        # Highlighted text is laid out for one width; redo it for the new one
+        if self._lexer is not None and self.size.width != self._rendered_width:
+            self._load_text()
+
     @work(thread=True, exclusive=True)
     def _load_text(self) -> None:
         """Read and highlight text in a background thread."""
         try:
-            file_size = self.path.stat().st_size
+            st = self.path.stat()
+            file_size = st.st_size
             if file_size > MAX_FILE_SIZE:
                 self.app.call_from_thread(
                     self._show_content,
@@ -117,23 +174,17 @@ class TextViewer(BaseViewer):
                     ),
                 )
                 return
-            raw = self.path.read_text(errors="replace")
-            lines = raw.split("\n", MAX_LINES + 1)
-            if len(lines) > MAX_LINES:
-                raw = "\n".join(lines[:MAX_LINES])
-                raw += f"\n\n... truncated at {MAX_LINES:,} lines ..."
-
-            lexer = _EXT_TO_LEXER.get(self.path.suffix.lower())
-            if lexer:
-                content = Syntax(
-                    raw,
-                    lexer,
-                    theme="monokai",
-                    line_numbers=True,
-                    word_wrap=False,
-                )
+
+            lexer = self._lexer
+            # Recorded up front so a Resize during this load doesn't start another
+            width = self._rendered_width = self.size.width
+            if lexer and width:
+                content = _highlighted(str(self.path), st.st_mtime_ns, file_size, lexer, width)
+            elif lexer:
+                # Not laid out yet — on_resize re-renders once the width is known
+                content = _render(_read_capped(self.path), lexer, 0)
             else:
-                content = Text(raw)
+                content = Text(_read_capped(self.path))
 
             self.app.call_from_thread(self._show_content, content)
         except Exception as e:
@@ -0,0 +1,196 @@
+"""Shared base for the TOML and YAML viewers — lazily built collapsible tree."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from itertools import islice
+
+from rich.style import Style
+from rich.text import Text
+from textual import on, work
+from textual.widgets import Static, Tree
+
+from ncview.viewers.base import BaseViewer
+from ncview.viewers.json_viewer import JsonTree, index_keys
+
+MAX_DEPTH = 50
+MAX_NODES = 50_000
+BUILD_CHUNK = 1_000  # children in the first batch when expanding
+
+# Parsed once here rather than from style strings on every label
+_STYLE_KEY = Style(bold=True, color="#f8f8f2")
+_STYLE_SEP = Style(color="#75715e")
+_STYLE_TYPE = Style(italic=True, color="#75715e")
+_STYLE_STR = Style(color="#a6e22e")
+_STYLE_BOOL = Style(color="#e6db74")
+_STYLE_NUM = Style(color="#ae81ff")
+_STYLE_OTHER = Style(color="#f8f8f2")
+
+
+class TreeViewer(BaseViewer):
+    """Displays a parsed document as a navigable collapsible tree.
+
+    Subclasses set the widget ids, format name and hints, and implement
+    _parse() to return the document and the file size.
+    """
+
+    INFO_ID = ""
+    TREE_ID = ""
+    FORMAT = ""
+    HINTS = "j/k: move  l: expand  h: collapse  space: toggle"
+    TREE_CLASS: type[JsonTree] = JsonTree
+
+    def __init__(self, path, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self._node_count = 0
+
+    @staticmethod
+    def priority() -> int:
+        return 5
+
+    def compose(self):
+        yield Static(id=self.INFO_ID)
+        yield self.TREE_CLASS("root", id=self.TREE_ID)
+
+    async def load_content(self) -> None:
+        self._parse_file()
+
+    @abstractmethod
+    def _parse(self) -> tuple[object, int]:
+        """Parse the file (runs in a worker thread). Returns (data, file size)."""
+        ...
+
+    @work(thread=True, exclusive=True)
+    def _parse_file(self) -> None:
+        try:
+            data, size = self._parse()
+        except Exception as e:
+            self.app.call_from_thread(self._show_error, f"Invalid {self.FORMAT}: {e}")
+            return
+        self.app.call_from_thread(self._populate_tree, data, size)
+
+    def _show_error(self, message: str) -> None:
+        tree = self.query_one(f"#{self.TREE_ID}", JsonTree)
+        tree.root.set_label(Text(message, style="bold red"))
+
+    def _populate_tree(self, data, size: int) -> None:
+        tree = self.query_one(f"#{self.TREE_ID}", JsonTree)
+        info = self.query_one(f"#{self.INFO_ID}", Static)
+
+        size_str = f"{size / 1024 / 1024:.1f} MB" if size >= 1024 * 1024 else f"{size / 1024:.1f} KB"
+        info_text = Text()
+        info_text.append(self.path.name, style="bold")
+        info_text.append(f"  ({size_str})", style="#75715e")
+        info_text.append(f"  {self.HINTS}", style="#75715e")
+        info.update(info_text)
+
+        tree.root.set_label(Text(self._describe_type(data), style="bold"))
+        self._node_count = 0
+        self._add_node(tree.root, None, data, 0)
+        tree.root.expand()
+        tree.focus()
+
+    def _describe_type(self, data) -> str:
+        if isinstance(data, dict):
+            return f"{self.path.name}  {{}} {len(data)} keys"
+        elif isinstance(data, list):
+            return f"{self.path.name}  [] {len(data)} items"
+        return self.path.name
+
+    def _add_node(self, parent, key: str | None, value, depth: int) -> None:
+        """Add one node. Containers get their children on first expand."""
+        if depth >= MAX_DEPTH:
+            parent.add_leaf(Text(f"... depth limit ({MAX_DEPTH})", style=_STYLE_TYPE))
+            return
+        self._node_count += 1
+        if isinstance(value, dict):
+            parent.add(self._make_label(key, f"{{}} {len(value)} keys"), data=(value, depth))
+        elif isinstance(value, list):
+            parent.add(self._make_label(key, f"[] {len(value)} items"), data=(value, depth))
+        else:
+            parent.add_leaf(self._format_value(key, value))
+
+    def _build_children(self, node, chunked: bool = False) -> None:
+        """Materialize a container node's children, once.
+
+        Only expanded nodes are ever built, so load time tracks what is on
+        screen rather than document size. MAX_NODES still caps the total.
+        With chunked=True, children are added in doubling batches (starting
+        at BUILD_CHUNK) with a repaint in between, so expanding a huge list
+        shows its head at once and doesn't freeze input. Doubling keeps the
+        number of passes, each of which re-lays-out the tree, logarithmic.
+        """
+        if node.data is None:
+            return
+        value, depth = node.data
+        node.data = None
+        if isinstance(value, dict):
+            items = iter(value.items())
+        else:
+            # Labels only up to the node budget, plus one to reach the marker
+            items = zip(index_keys(min(len(value), MAX_NODES - self._node_count + 1)), value)
+        self._add_children(node, items, depth, BUILD_CHUNK if chunked else None)
+
+    def _add_children(self, node, items, depth: int, chunk: int | None) -> None:
+        batch = items if chunk is None else islice(items, chunk)
+        added = 0
+        with node.tree.batch_add():
+            for k, v in batch:
+                if self._node_count >= MAX_NODES:
+                    node.add_leaf(Text(f"... truncated ({MAX_NODES:,} node limit)", style=_STYLE_TYPE))
+                    return
+                self._add_node(node, str(k), v, depth + 1)
+                added += 1
+        if chunk is not None and added == chunk:
+            self.call_after_refresh(self._add_children, node, items, depth, chunk * 2)
+
+    @on(Tree.NodeExpanded)
+    def _on_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        self._build_children(event.node, chunked=True)
+
+    def _make_label(self, key: str | None, type_info: str) -> Text:
+        text = Text()
+        if key is not None:
+            text.append(key, _STYLE_KEY)
+            text.append(": ", _STYLE_SEP)
+        text.append(type_info, _STYLE_TYPE)
+        return text
+
+    def _format_value(self, key: str | None, value) -> Text:
+        text = Text()
+        if key is not None:
+            text.append(key, _STYLE_KEY)
+            text.append(": ", _STYLE_SEP)
+        _VALUE_FORMATTERS.get(type(value), _append_repr)(text, value)
+        return text
+
+
+# One dict lookup on the exact type instead of an isinstance chain; anything
+# else the parser yields (dates, datetimes) falls through to repr
+def _append_str(text: Text, value: str) -> None:
+    text.append(f'"{value}"', _STYLE_STR)
+
+
+def _append_bool(text: Text, value: bool) -> None:
+    text.append("true" if value else "false", _STYLE_BOOL)
+
+
+def _append_number(text: Text, value: int | float) -> None:
+    text.append(str(value), _STYLE_NUM)
+
+
+def _append_null(text: Text, value: None) -> None:
+    text.append("null", _STYLE_TYPE)
+
+
+def _append_repr(text: Text, value) -> None:
+    text.append(repr(value), _STYLE_OTHER)
+
+
+_VALUE_FORMATTERS = {
+    str: _append_str,
+    bool: _append_bool,
+    int: _append_number,
+    float: _append_number,
+    type(None): _append_null,
+}
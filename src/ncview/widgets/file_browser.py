@@ -8,18 +8,40 @@ import shlex
 import shutil
 import stat
 import subprocess
+import sys
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 
-from rich.text import Text
+from rich.cells import cell_len
+from rich.style import Style
+from rich.text import Span, Text
 from textual import on, work
 from textual.events import Key
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import DataTable, Input
 
 from ncview.utils.clipboard import copy_to_clipboard
-from ncview.utils.file_info import file_icon, human_size
+from ncview.utils.config import editor_command
+from ncview.utils.dir_watch import DirWatcher, start_watcher
+from ncview.utils.file_info import file_icon_for_name, human_size
+
+if sys.platform == "darwin":
+    try:
+        from ncview.utils._bulkdir import scan_dir as _bulk_scan_dir
+    except (OSError, AttributeError):  # libc without getattrlistbulk
+        _bulk_scan_dir = None
+else:
+    _bulk_scan_dir = None
 
 
 class SortKey(Enum):
@@ -38,6 +60,271 @@ def _format_perms(mode: int) -> str:
     return "".join(c if mode & b else "-" for b, c in bits)
 
 
+# (dir names, file names, stat by name, symlink target by name)
+_ScanResult = tuple[list[str], list[str], dict[str, os.stat_result], dict[str, str]]
+
+_STALE_CHECK_MASK = 255  # poll for a newer load every 256 entries
+_DIR_CACHE_SIZE = 64  # directory scans kept for instant re-entry
+_WATCHED = object()  # dir cache token: valid until the watcher reports a change
+_STAT_PROBE = 64  # stats timed before deciding the mount is slow
+_SLOW_STAT_SECONDS = 200e-6  # average above this looks like a network round trip
+_STAT_WORKERS = 16
+_FAILED_STAT_TTL = 2.0  # seconds a failed stat() is remembered and not retried
+
+# path -> monotonic expiry. Broken symlinks and unreadable entries otherwise
+# fail the same stat() (twice, for symlinks) on every reload and sort change.
+# Written from the _stat_pool() threads as well as the load worker.
+_failed_stats: dict[str, float] = {}
+_failed_stats_lock = threading.Lock()
+
+
+def _recently_failed(path: str) -> bool:
+    with _failed_stats_lock:
+        expiry = _failed_stats.get(path)
+        if expiry is None:
+            return False
+        if time.monotonic() < expiry:
+            return True
+        del _failed_stats[path]
+        return False
+
+
+def _note_failed(path: str) -> None:
+    now = time.monotonic()
+    with _failed_stats_lock:
+        if len(_failed_stats) >= 1024:
+            for p in [p for p, expiry in _failed_stats.items() if expiry <= now]:
+                del _failed_stats[p]
+        _failed_stats[path] = now + _FAILED_STAT_TTL
+
+
+def _stat_entry(path: str, e: os.DirEntry) -> os.stat_result | None:
+    """Following stat() of an entry of directory `path`, or None if it fails."""
+    try:
+        return e.stat(follow_symlinks=True)
+    except OSError:
+        _note_failed(os.path.join(path, e.name))
+        return None
+
+
+def _open_dir(path: str) -> int | None:
+    """A directory fd to scandir() instead of the path. Entries then stat
+    with fstatat() on their bare name, so the kernel doesn't walk every
+    component of `path` again for each one."""
+    if os.scandir not in os.supports_fd:
+        return None
+    try:
+        return os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return None
+
+
+def _scan_directory(
+    path: str, show_hidden: bool, stat_dirs: bool, stale: Callable[[], bool],
+) -> _ScanResult:
+    """List a directory, stat'ing entries with as few syscalls as possible.
+
+    Symlinks are followed for type and stat; broken ones list as files
+    with no stat. Directories are only stat'ed when stat_dirs is set.
+    Stops early, returning a partial listing, once stale() is true.
+    """
+    if _bulk_scan_dir is not None:
+        try:
+            return _scan_bulk(path, show_hidden, stale)
+        except OSError:
+            pass
+    return _scan_entries(path, show_hidden, stat_dirs, stale)
+
+
+def _scan_entries(
+    path: str, show_hidden: bool, stat_dirs: bool, stale: Callable[[], bool],
+) -> _ScanResult:
+    """One pass over scandir. is_dir()/is_symlink() come from the cached
+    d_type, so stat() is the only per-entry syscall.
+
+    The first _STAT_PROBE stats are timed. If they average network-mount
+    latency, the rest go to a thread pool so the round trips overlap.
+    """
+    dir_fd = _open_dir(path)
+    try:
+        return _scan_entries_from(path, dir_fd, show_hidden, stat_dirs, stale)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+
+def _scan_entries_from(
+    path: str, dir_fd: int | None, show_hidden: bool, stat_dirs: bool, stale: Callable[[], bool],
+) -> _ScanResult:
+    """_scan_entries() body. Entry stats and readlinks are relative to
+    dir_fd when it is given, so it must stay open until this returns."""
+    dir_names: list[str] = []
+    file_names: list[str] = []
+    stat_cache: dict[str, os.stat_result] = {}
+    symlinks: dict[str, str] = {}
+    deferred: list[os.DirEntry] = []
+    probed = 0
+    probe_time = 0.0
+    slow = False
+    try:
+        with os.scandir(path if dir_fd is None else dir_fd) as it:
+            for i, e in enumerate(it):
+                if not i & _STALE_CHECK_MASK and stale():
+                    break
+                name = e.name
+                if not show_hidden and name.startswith("."):
+                    continue
+                failed = bool(_failed_stats) and _recently_failed(os.path.join(path, name))
+                try:
+                    # A symlink's is_dir() is itself a stat — skip it if that just failed
+                    is_dir = False if failed and e.is_symlink() else e.is_dir(follow_symlinks=True)
+                except OSError:
+                    is_dir = False
+                (dir_names if is_dir else file_names).append(name)
+                if (stat_dirs or not is_dir) and not failed:
+                    if slow:
+                        deferred.append(e)
+                    elif probed < _STAT_PROBE:
+                        t0 = time.perf_counter()
+                        st = _stat_entry(path, e)
+                        probe_time += time.perf_counter() - t0
+                        probed += 1
+                        slow = probed == _STAT_PROBE and probe_time > _STAT_PROBE * _SLOW_STAT_SECONDS
+                        if st is not None:
+                            stat_cache[name] = st
+                    else:
+                        st = _stat_entry(path, e)
+                        if st is not None:
+                            stat_cache[name] = st
+                try:
+                    if e.is_symlink():
+                        # e.path is the bare name when scanning dir_fd
+                        symlinks[name] = os.readlink(e.path, dir_fd=dir_fd)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    if deferred and not stale():
+        stat_cache.update(_stat_parallel(path, deferred, stale))
+    return dir_names, file_names, stat_cache, symlinks
+
+
+@lru_cache(maxsize=1)
+def _stat_pool() -> ThreadPoolExecutor:
+    """Shared pool for _stat_parallel, created on first use."""
+    return ThreadPoolExecutor(max_workers=_STAT_WORKERS, thread_name_prefix="ncview-stat")
+
+
+def _stat_parallel(
+    path: str, entries: list[os.DirEntry], stale: Callable[[], bool],
+) -> dict[str, os.stat_result]:
+    """stat() entries from _STAT_WORKERS threads, one strided slice each."""
+
+    def stat_slice(chunk: list[os.DirEntry]) -> dict[str, os.stat_result]:
+        out: dict[str, os.stat_result] = {}
+        for i, e in enumerate(chunk):
+            if not i & _STALE_CHECK_MASK and stale():
+                break
+            st = _stat_entry(path, e)
+            if st is not None:
+                out[e.name] = st
+        return out
+
+    result: dict[str, os.stat_result] = {}
+    slices = [entries[k::_STAT_WORKERS] for k in range(_STAT_WORKERS)]
+    for part in _stat_pool().map(stat_slice, slices):
+        result.update(part)
+    return result
+
+
+def _scan_bulk(path: str, show_hidden: bool, stale: Callable[[], bool]) -> _ScanResult:
+    """macOS: names, types, sizes and mtimes from getattrlistbulk, many
+    entries per syscall. Only symlinks cost an extra stat."""
+    dir_names: list[str] = []
+    file_names: list[str] = []
+    stat_cache: dict[str, os.stat_result] = {}
+    symlinks: dict[str, str] = {}
+    for i, (name, st) in enumerate(_bulk_scan_dir(path)):
+        if not i & _STALE_CHECK_MASK and stale():
+            break
+        if not show_hidden and name.startswith("."):
+            continue
+        if st is None or stat.S_ISLNK(st.st_mode):
+            full = os.path.join(path, name)
+            if st is not None:
+                try:
+                    symlinks[name] = os.readlink(full)
+                except OSError:
+                    pass
+            if _failed_stats and _recently_failed(full):
+                st = None
+            else:
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    _note_failed(full)
+                    st = None
+        if st is None:
+            file_names.append(name)
+            continue
+        (dir_names if stat.S_ISDIR(st.st_mode) else file_names).append(name)
+        stat_cache[name] = st
+    return dir_names, file_names, stat_cache, symlinks
+
+
+# Row styles, parsed once rather than from strings on every label
+_STYLE_DIR = Style(bold=True, color="#66d9ef")
+_STYLE_FILE = Style(color="#f8f8f2")
+_STYLE_LINK = Style(color="#75715e")
+_STYLE_PARENT = Style(bold=True, color="#e6db74")
+_STYLE_GIT_NEW = Style(bold=True, color="#a6e22e")
+_STYLE_GIT_MODIFIED = Style(bold=True, color="#fd971f")
+_STYLE_GIT_DELETED = Style(bold=True, color="#f92672")
+_STYLE_GIT_OTHER = Style(bold=True, color="#ae81ff")
+
+# Never mutated, so every listing shares it
+_PARENT_LABEL = Text("\uf07b ..", spans=[Span(0, 4, _STYLE_PARENT)])
+
+
+def _git_marker(xy: str) -> tuple[str, Style]:
+    """Two-cell marker and style for a porcelain XY status."""
+    if xy == "??":
+        return "? ", _STYLE_GIT_NEW
+    if xy[0] in "MADRC":
+        return "+ ", _STYLE_GIT_NEW
+    if xy[1] == "M":
+        return "~ ", _STYLE_GIT_MODIFIED
+    if xy[1] == "D":
+        return "- ", _STYLE_GIT_DELETED
+    return "* ", _STYLE_GIT_OTHER
+
+
+# Rows materialized in the DataTable at once. Longer listings keep the
+# window centred on the viewport, so a load builds O(window) rows, not O(N).
+_WINDOW_ROWS = 1_000
+_WINDOW_MARGIN = 200  # recentre when the viewport gets this close to an edge
+_HIGHLIGHT_DEBOUNCE = 0.05  # seconds between highlights that count as one held key
+
+
+def _name_column_width(
+    names: list[str], n_dirs: int, icons: list[str], has_git: bool, symlinks: dict[str, str],
+) -> int:
+    """Widest Name cell across the whole listing, measured without building Text.
+
+    A windowed table only sees its own rows, so the column is sized up front
+    to keep it from changing width as the window moves.
+    """
+    width = 4  # ".." row
+    marker = 2 if has_git else 0
+    for i, name in enumerate(names):
+        w = marker + cell_len(icons[i]) + 1 + cell_len(name) + (i < n_dirs)
+        if name in symlinks:
+            w += 3 + cell_len(symlinks[name])
+        if w > width:
+            width = w
+    return width
+
+
 class InputMode(Enum):
     NONE = "none"
     SEARCH = "search"
@@ -110,6 +397,7 @@ class FileBrowser(Widget):
         ("G", "jump_bottom", "Bottom"),  # noqa: E741
         ("full_stop", "toggle_hidden", "Toggle hidden"),
         ("s", "cycle_sort", "Cycle sort"),
+        ("R", "refresh", "Refresh"),  # noqa: E741
         ("slash", "start_search", "Search"),
         ("e", "open_editor", "Editor"),
         ("E", "open_editor_path", "Edit path"),  # noqa: E741
@@ -131,12 +419,27 @@ class FileBrowser(Widget):
         super().__init__(**kwargs)
         self.current_dir = (start_path or Path.cwd()).absolute()
         self._load_gen = 0
-        self._entries: list[Path] = []
+        self._names: list[str] = []
+        self._search_blob: str | None = None
+        self._search_starts: list[int] = []
+        self._names_lower: list[str] = []
+        self._n_dirs = 0
+        self._icons: list[str] = []
+        self._size_texts: list[str] = []
+        self._perms: list[str] | None = None
+        self._git_status: dict[str, str] | None = None
+        self._symlinks: dict[str, str] = {}
+        self._parent_rows = 0  # 1 when the ".." row is shown
+        self._window_start = 0
+        self._recenter_pending = False
+        self._highlight_timer: Timer | None = None
+        self._pending_highlight: Path | None = None
+        self._last_highlight = 0.0
+        self._columns_perms: bool | None = None  # None until the columns exist
         self._show_hidden = False
         self._sort_key = SortKey.NAME
         self._input_mode = InputMode.NONE
         self._rename_path: Path | None = None
-        self._path_map: dict[str, Path] = {}
         self._search_query = ""
         self._search_matches: list[int] = []
         self._search_index = -1
@@ -146,6 +449,12 @@ class FileBrowser(Widget):
         self._focus_name: str | None = None
         self._dir_mtime: float = 0.0
         self._filter_pattern: str = ""
+        # (path, show_hidden, stat_dirs) -> (dir mtime_ns or _WATCHED, scan), most recent last
+        self._dir_cache: OrderedDict[tuple[str, bool, bool], tuple[object, _ScanResult]] = OrderedDict()
+        self._dir_cache_lock = threading.Lock()
+        self._watcher: DirWatcher | None = None
+        self._changed_dirs: set[str] = set()  # watcher events since each dir's last scan
+        self._dir_changed = False  # set from the watcher thread, read by the poll
 
     def compose(self):
         yield DataTable(id="file-list", cursor_type="row", show_header=False)
@@ -158,11 +467,35 @@ class FileBrowser(Widget):
         yield Input(placeholder="Filter regex (e.g. \\.py$, test_.*, \\.(js|ts)$)...", id="filter-input")
 
     def on_mount(self) -> None:
+        # Cached once — cursor actions and highlight events hit this every keystroke
+        self._table = self.query_one("#file-list", DataTable)
+        self.watch(self._table, "scroll_y", self._on_table_scrolled, init=False)
+        self._watcher = start_watcher(self._on_dir_event)
         self._load_directory()
         self.set_interval(2.0, self._check_for_changes)
 
+    def on_unmount(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def _on_dir_event(self, path: str) -> None:
+        """Watcher callback (watchdog's thread): `path` changed, or is no
+        longer watched."""
+        with self._dir_cache_lock:
+            self._changed_dirs.add(path)
+        self._forget_dir(path)
+        if path == str(self.current_dir):
+            self._dir_changed = True
+
     def _check_for_changes(self) -> None:
-        """Poll directory mtime and reload if files were added/removed."""
+        """Reload if files were added/removed: on a watcher event when the
+        directory is watched, otherwise by polling its mtime."""
+        if self._dir_changed:
+            self._dir_changed = False
+            self._load_directory()
+            return
+        if self._watcher is not None and self._watcher.watching(str(self.current_dir)):
+            return
         try:
             mtime = os.stat(self.current_dir).st_mtime
             if mtime != self._dir_mtime and self._dir_mtime != 0.0:
@@ -200,146 +533,219 @@ class FileBrowser(Widget):
         if self._input_mode == InputMode.RENAME:
             self._rename_path = None
         self._input_mode = InputMode.NONE
-        self.query_one("#file-list", DataTable).focus()
+        self._table.focus()
 
-    @work(thread=True, exclusive=True)
     def _load_directory(self) -> None:
-        """Load directory contents in a background thread."""
+        """Load directory contents in a background thread.
+
+        The generation is bumped here, on the UI thread, so a load that is
+        still running notices straight away and stops rather than finishing
+        a scan (and a git status) whose result would be thrown away.
+        """
         self._load_gen += 1
-        gen = self._load_gen
+        self._load_directory_worker(self._load_gen)
 
-        try:
-            self._dir_mtime = os.stat(self.current_dir).st_mtime
-        except OSError:
-            self._dir_mtime = 0.0
+    @work(thread=True, exclusive=True)
+    def _load_directory_worker(self, gen: int) -> None:
+        def stale() -> bool:
+            return gen != self._load_gen
 
+        # git runs in its own processes while the directory is scanned
+        git = self._start_git_status()
         try:
-            scan = list(os.scandir(self.current_dir))
-        except (PermissionError, OSError):
-            scan = []
-
-        if not self._show_hidden:
-            scan = [e for e in scan if not e.name.startswith(".")]
-
-        # Partition using cached is_dir (no extra stat)
-        dir_entries = []
-        file_entries = []
-        for e in scan:
-            try:
-                if e.is_dir(follow_symlinks=True):
-                    dir_entries.append(e)
-                else:
-                    file_entries.append(e)
-            except OSError:
-                file_entries.append(e)
-
-        # Cache stat results once per entry for sorting, sizes, and permissions
-        stat_cache: dict[str, os.stat_result] = {}
-        for e in scan:
+            if not self._load_listing(gen, stale):
+                return
+            git_status = self._read_git_status(git)
+            if git_status and not stale():
+                self.app.call_from_thread(self._apply_git_status, gen, git_status)
+        finally:
+            for proc in git:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+
+    def _load_listing(self, gen: int, stale: Callable[[], bool]) -> bool:
+        """Scan, sort and show the current directory (worker thread).
+        False if a newer load made the result stale."""
+        path = str(self.current_dir)
+        # A watched directory's cached scan holds until an event drops it,
+        # so a reload or re-entry needs no syscall at all
+        token: object = None
+        if self._watcher is not None and self._watcher.watch(path):
+            token = _WATCHED
+        else:
             try:
-                stat_cache[e.name] = e.stat(follow_symlinks=True)
+                st = os.stat(path)
+                self._dir_mtime = st.st_mtime
+                token = st.st_mtime_ns
             except OSError:
-                pass
+                self._dir_mtime = 0.0
 
         sort_key = self._sort_key
-        def _sort_func(entry: os.DirEntry) -> object:
-            if sort_key == SortKey.SIZE:
-                st = stat_cache.get(entry.name)
+        dir_names, file_names, stat_cache, symlinks = self._scan_cached(
+            path,
+            self._show_hidden,
+            sort_key != SortKey.NAME or self._show_perms,
+            token,
+            stale,
+        )
+        if stale():
+            return False
+
+        # Key chosen once, not re-dispatched per element; NAME (the default)
+        # sorts on the C-level str.lower with no Python call per entry
+        if sort_key == SortKey.SIZE:
+            def _sort_func(name: str) -> object:
+                st = stat_cache.get(name)
                 return st.st_size if st else 0
-            elif sort_key == SortKey.MODIFIED:
-                st = stat_cache.get(entry.name)
+        elif sort_key == SortKey.MODIFIED:
+            def _sort_func(name: str) -> object:
+                st = stat_cache.get(name)
                 return -st.st_mtime if st else 0
-            return entry.name.lower()
+        else:
+            _sort_func = str.lower
 
-        dir_entries.sort(key=_sort_func)
-        file_entries.sort(key=_sort_func)
+        dir_names.sort(key=_sort_func)
+        file_names.sort(key=_sort_func)
 
         # Apply file type filter (directories always shown)
         if self._filter_pattern:
             try:
                 regex = re.compile(self._filter_pattern, re.IGNORECASE)
-                file_entries = [e for e in file_entries if regex.search(e.name)]
+                file_names = [n for n in file_names if regex.search(n)]
             except re.error:
                 pass
 
-        # Build Path lists, dir names set, and sizes dict
-        dirs = [Path(e.path) for e in dir_entries]
-        files = [Path(e.path) for e in file_entries]
-        all_entries = dirs + files
-        dir_names = {e.name for e in dir_entries}
-
-        sizes: dict[str, int] = {}
-        for e in file_entries:
-            try:
-                st = stat_cache.get(e.name) or e.stat(follow_symlinks=True)
-                sizes[e.name] = st.st_size
-            except OSError:
-                pass
+        # Everything the rows need, as parallel lists indexed like `names`,
+        # so the UI thread only assembles Text — no syscalls or Path objects
+        names = dir_names + file_names
+        n_dirs = len(dir_names)
+        icons = [file_icon_for_name(n, True) for n in dir_names]
+        icons += [file_icon_for_name(n, False) for n in file_names]
+        size_texts = [""] * n_dirs
+        size_texts += [human_size(stat_cache[n].st_size) if n in stat_cache else "" for n in file_names]
 
-        perms: dict[str, str] = {}
+        perms: list[str] | None = None
         if self._show_perms:
-            for e in scan:
-                st = stat_cache.get(e.name)
-                if st:
-                    perms[e.name] = _format_perms(st.st_mode)
+            perms = [_format_perms(stat_cache[n].st_mode) if n in stat_cache else "" for n in names]
 
-        symlinks: dict[str, str] = {}
-        for e in scan:
-            try:
-                if e.is_symlink():
-                    symlinks[e.name] = os.readlink(e.path)
-            except OSError:
-                pass
-
-        # Git status — only if we're in a git repo, with a timeout
-        git_status = self._get_git_status()
+        name_width = None
+        if len(names) >= _WINDOW_ROWS:
+            name_width = _name_column_width(names, n_dirs, icons, True, symlinks)
 
         # Drop stale results if the user navigated away while we were loading
-        if gen != self._load_gen:
-            return
-        self.app.call_from_thread(self._populate_list, gen, all_entries, dir_names, sizes, git_status, perms, symlinks)
-
-    def _get_git_status(self) -> dict[str, str]:
-        """Get git status for files in the current directory. Returns empty dict if not a repo."""
+        if stale():
+            return False
+        # Show the listing now, with blank git markers: git status is a
+        # subprocess that can take far longer than the scan in a big repo
+        self.app.call_from_thread(
+            self._populate_list, gen, names, n_dirs, icons, size_texts, {}, perms, symlinks,
+            name_width,
+        )
+        return True
+
+    def _scan_cached(
+        self, path: str, show_hidden: bool, stat_dirs: bool, token: object,
+        stale: Callable[[], bool],
+    ) -> _ScanResult:
+        """_scan_directory(), reusing the last scan while `token` matches —
+        the directory's mtime_ns, so re-entry costs one stat(), or _WATCHED,
+        which holds until the watcher reports a change.
+
+        Git status is not cached, so change markers stay current. File sizes
+        can lag until an entry is added, removed or renamed — the watcher
+        ignores plain writes, as the mtime does — so refresh (R), size and
+        time sorts and the permissions toggle drop the cached scan first.
+        """
+        key = (path, show_hidden, stat_dirs)
+        with self._dir_cache_lock:
+            hit = self._dir_cache.get(key)
+            if hit is not None and hit[0] == token:
+                self._dir_cache.move_to_end(key)
+                dir_names, file_names, stat_cache, symlinks = hit[1]
+                # Copies: the caller sorts and filters these in place
+                return list(dir_names), list(file_names), stat_cache, symlinks
+            # An event from here on means this scan may already be out of date
+            self._changed_dirs.discard(path)
+        result = _scan_directory(path, show_hidden, stat_dirs, stale)
+        if token is not None and not stale():
+            with self._dir_cache_lock:
+                if token is _WATCHED and path in self._changed_dirs:
+                    return result
+                self._dir_cache[key] = (token, result)
+                self._dir_cache.move_to_end(key)
+                if len(self._dir_cache) > _DIR_CACHE_SIZE:
+                    self._dir_cache.popitem(last=False)
+            result = (list(result[0]), list(result[1]), result[2], result[3])
+        return result
+
+    def _forget_dir(self, path: Path | str | None = None) -> None:
+        """Drop cached scans of `path`, or of every directory, after a change
+        made from inside the app (mtime resolution can hide it)."""
+        with self._dir_cache_lock:
+            if path is None:
+                self._dir_cache.clear()
+                return
+            target = str(path)
+            for key in [k for k in self._dir_cache if k[0] == target]:
+                del self._dir_cache[key]
+
+    def _start_git_status(self) -> list[subprocess.Popen]:
+        """Launch the git processes for the current directory's status: the
+        path prefix from the repo root, and the status itself. Both start
+        at once, without waiting; empty if git can't be run."""
+        procs: list[subprocess.Popen] = []
         try:
-            # Get the path prefix from repo root to current dir
-            prefix_result = subprocess.run(
+            for args in (
                 ["git", "rev-parse", "--show-prefix"],
-                cwd=str(self.current_dir),
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if prefix_result.returncode != 0:
-                return {}
-            prefix = prefix_result.stdout.strip()  # e.g. "src/ncview/"
-
-            result = subprocess.run(
-                ["git", "status", "--porcelain", "-unormal", "."],
-                cwd=str(self.current_dir),
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode != 0:
-                return {}
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+                ["git", "--no-optional-locks", "status", "--porcelain", "-z", "-unormal", "."],
+            ):
+                procs.append(subprocess.Popen(
+                    args,
+                    cwd=str(self.current_dir),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                ))
+        except OSError:
+            for proc in procs:
+                proc.kill()
+                proc.wait()
+            return []
+        return procs
+
+    def _read_git_status(self, procs: list[subprocess.Popen]) -> dict[str, str]:
+        """Git status for files in the current directory, from the processes
+        _start_git_status() launched. Returns empty dict if not a repo."""
+        if not procs:
             return {}
+        deadline = time.monotonic() + 2
+        outputs: list[bytes] = []
+        try:
+            for proc in procs:
+                out, _ = proc.communicate(timeout=max(deadline - time.monotonic(), 0.01))
+                if proc.returncode != 0:
+                    return {}
+                outputs.append(out)
+        except (subprocess.TimeoutExpired, OSError):
+            return {}
+        prefix = outputs[0].strip()  # e.g. b"src/ncview/"
 
+        # -z: NUL-terminated records, paths raw rather than C-quoted
         status_map: dict[str, str] = {}
-        for line in result.stdout.splitlines():
-            if len(line) < 4:
+        records = iter(outputs[1].split(b"\0"))
+        for record in records:
+            if len(record) < 4:
                 continue
-            xy = line[:2]
-            filepath = line[3:]
-            # Unquote git C-style quoting for paths with special chars
-            if filepath.startswith('"') and filepath.endswith('"'):
-                filepath = filepath[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+            xy = record[:2].decode("ascii", "replace")
+            if xy[0] in "RC":
+                next(records, None)  # the rename/copy source is a record of its own
+            filepath = record[3:]
             # Strip repo-root prefix to get path relative to current dir
             if prefix and filepath.startswith(prefix):
                 filepath = filepath[len(prefix):]
-            # Only care about direct children of current dir
-            name = filepath.split("/")[0]
+            # Only care about direct children of current dir; decoded the
+            # way scandir decodes, so undecodable names still match
+            name = os.fsdecode(filepath.split(b"/", 1)[0])
             if name not in status_map:
                 status_map[name] = xy
             else:
@@ -350,87 +756,54 @@ class FileBrowser(Widget):
     def _populate_list(
         self,
         gen: int,
-        entries: list[Path],
-        dir_names: set[str],
-        sizes: dict[str, int],
+        names: list[str],
+        n_dirs: int,
+        icons: list[str],
+        size_texts: list[str],
         git_status: dict[str, str] | None = None,
-        perms: dict[str, str] | None = None,
+        perms: list[str] | None = None,
         symlinks: dict[str, str] | None = None,
+        name_width: int | None = None,
     ) -> None:
-        """Rebuild the DataTable with current entries."""
+        """Rebuild the DataTable with current entries.
+
+        names lists directories (the first n_dirs) then files; icons,
+        size_texts and perms are indexed the same way. Only a window of
+        _WINDOW_ROWS rows is put in the table; see _set_window().
+        """
         # Discard if a newer load has already been requested
         if gen != self._load_gen:
             return
-        self._entries = entries
-        self._path_map.clear()
-        dt = self.query_one("#file-list", DataTable)
-        dt.clear(columns=True)
+        self._names = names
+        self._search_blob = None  # rebuilt on the next search
+        self._n_dirs = n_dirs
+        self._icons = icons
+        self._size_texts = size_texts
+        self._perms = perms
+        self._git_status = git_status
+        self._symlinks = symlinks or {}
+        self._parent_rows = 1 if self.current_dir != Path(self.current_dir.root) else 0
 
-        show_perms = bool(perms)
-        dt.add_column("Name", key="name")
-        if show_perms:
-            dt.add_column("Perms", key="perms")
-        dt.add_column("Size", key="size")
-
-        rows: list[tuple] = []
-        keys: list[str] = []
-
-        # Add parent directory entry
-        if self.current_dir != Path(self.current_dir.root):
-            label = Text()
-            label.append("\uf07b ", style="bold #e6db74")
-            label.append("..", style="bold #e6db74")
-            row = (label, "", "") if show_perms else (label, "")
-            rows.append(row)
-            keys.append("..")
-            self._path_map[".."] = self.current_dir.parent
-
-        has_git = git_status is not None
-        for entry in entries:
-            is_dir = entry.name in dir_names
-            label = Text()
-            # Git status marker
-            if has_git and entry.name in git_status:
-                xy = git_status[entry.name]
-                if xy == "??":
-                    label.append("? ", style="bold #a6e22e")
-                elif xy[0] in "MADRC":
-                    label.append("+ ", style="bold #a6e22e")
-                elif xy[1] == "M":
-                    label.append("~ ", style="bold #fd971f")
-                elif xy[1] == "D":
-                    label.append("- ", style="bold #f92672")
-                else:
-                    label.append("* ", style="bold #ae81ff")
-            elif has_git:
-                label.append("  ")
-            icon = file_icon(entry, is_dir=is_dir)
-            label.append(f"{icon} ")
-            if is_dir:
-                label.append(entry.name + "/", style="bold #66d9ef")
-                size_text = ""
-            else:
-                label.append(entry.name, style="#f8f8f2")
-                size_text = human_size(sizes[entry.name]) if entry.name in sizes else ""
-            if symlinks and entry.name in symlinks:
-                label.append(" \u2192 ", style="#75715e")
-                label.append(symlinks[entry.name], style="#75715e")
-            perm_text = perms.get(entry.name, "") if show_perms else None
-            if show_perms:
-                rows.append((label, perm_text, size_text))
-            else:
-                rows.append((label, size_text))
-            keys.append(entry.name)
-            self._path_map[entry.name] = entry
+        # Restore cursor to previously visited directory, or default to first row
+        target_row = 0
+        if self._focus_name:
+            try:
+                target_row = self._parent_rows + names.index(self._focus_name)
+            except ValueError:
+                pass
+            self._focus_name = None
 
-        # Batch add all rows at once
-        for row, key in zip(rows, keys):
-            dt.add_row(*row, key=key)
+        # One repaint for the column reset, the rows and the cursor move
+        with self.app.batch_update():
+            self._prepare_columns(perms is not None, name_width)
+            self._set_window(0)
+            if self._table.row_count > 0:
+                self._move_to(target_row)
 
         sort_label = self._sort_key.value
         hidden_label = "shown" if self._show_hidden else "hidden"
-        count_dirs = len(dir_names)
-        count_files = len(entries) - count_dirs
+        count_dirs = n_dirs
+        count_files = len(names) - count_dirs
         total = count_dirs + count_files
         filter_label = f" | filter:{self._filter_pattern}" if self._filter_pattern else ""
         self._base_subtitle = f"{total} items ({count_dirs} dirs, {count_files} files) | sort:{sort_label} | hidden:{hidden_label}{filter_label}"
@@ -445,20 +818,163 @@ class FileBrowser(Widget):
         # Post directory changed
         self.post_message(DirectoryChanged(self.current_dir))
 
-        # Restore cursor to previously visited directory, or default to first row
-        target_row = 0
-        if self._focus_name:
-            for i, key in enumerate(keys):
-                if key == self._focus_name:
-                    target_row = i
-                    break
-            self._focus_name = None
-        if dt.row_count > 0:
-            dt.move_cursor(row=target_row)
+    def _apply_git_status(self, gen: int, git_status: dict[str, str]) -> None:
+        """Fill in the git markers once status arrives, after the listing is shown."""
+        if gen != self._load_gen:
+            return
+        self._git_status = git_status
+        dt = self._table
+        start = self._window_start
+        with self.app.batch_update():
+            # Rows outside the window pick the status up when they're built
+            for index in range(max(start, self._parent_rows), start + dt.row_count):
+                if self._names[index - self._parent_rows] in git_status:
+                    key, row = self._make_row(index)
+                    dt.update_cell(key, "name", row[0])
+
+    def _prepare_columns(self, show_perms: bool, name_width: int | None) -> None:
+        """Set up the columns for a new listing.
+
+        They are only rebuilt when the perms column comes or goes. Otherwise
+        the existing ones are kept and their auto-width measurements reset,
+        since clear() alone would let them keep the last listing's widths.
+        """
+        dt = self._table
+        if self._columns_perms is not show_perms:
+            dt.clear(columns=True)
+            dt.add_column("Name", key="name", width=name_width)
+            if show_perms:
+                dt.add_column("Perms", key="perms")
+            dt.add_column("Size", key="size")
+            self._columns_perms = show_perms
+            return
+        for column in dt.columns.values():
+            column.content_width = column.label.cell_len
+        name_column = dt.columns["name"]
+        name_column.auto_width = name_width is None
+        name_column.width = name_column.content_width if name_width is None else name_width
+
+    def _make_row(self, index: int) -> tuple[str, tuple]:
+        """Key and cells for row `index` of the listing (".." counts as row 0).
+
+        The label is one Text built from a joined string and a few spans
+        with prebuilt styles, rather than one append (and style parse) per
+        piece.
+        """
+        show_perms = self._perms is not None
+        if index < self._parent_rows:
+            return "..", ((_PARENT_LABEL, "", "") if show_perms else (_PARENT_LABEL, ""))
+
+        i = index - self._parent_rows
+        name = self._names[i]
+        git_status = self._git_status
+        spans: list[Span] = []
+        # Git status marker
+        if git_status is None:
+            marker = ""
+        elif name in git_status:
+            marker, marker_style = _git_marker(git_status[name])
+            spans.append(Span(0, 2, marker_style))
+        else:
+            marker = "  "
+        start = len(marker) + len(self._icons[i]) + 1
+        if i < self._n_dirs:
+            plain = f"{marker}{self._icons[i]} {name}/"
+            spans.append(Span(start, len(plain), _STYLE_DIR))
+        else:
+            plain = f"{marker}{self._icons[i]} {name}"
+            spans.append(Span(start, len(plain), _STYLE_FILE))
+        target = self._symlinks.get(name)
+        if target is not None:
+            start = len(plain)
+            plain = f"{plain} \u2192 {target}"
+            spans.append(Span(start, len(plain), _STYLE_LINK))
+        label = Text(plain, spans=spans)
+        if show_perms:
+            return name, (label, self._perms[i], self._size_texts[i])
+        return name, (label, self._size_texts[i])
+
+    def _row_total(self) -> int:
+        return self._parent_rows + len(self._names)
+
+    def _set_window(self, start: int) -> None:
+        """Fill the table with rows [start, start + _WINDOW_ROWS) of the listing."""
+        self._window_start = start
+        dt = self._table
+        dt.clear()
+        make_row = self._make_row
+        for index in range(start, min(self._row_total(), start + _WINDOW_ROWS)):
+            key, row = make_row(index)
+            dt.add_row(*row, key=key)
+
+    def _move_to(self, index: int) -> None:
+        """Put the cursor on row `index` of the listing, moving the window if needed."""
+        start = self._window_start
+        if not start <= index < start + self._table.row_count:
+            start = max(0, min(index - _WINDOW_ROWS // 2, self._row_total() - _WINDOW_ROWS))
+            self._set_window(start)
+            # Centre the target now, before a pending recentre sees scroll_y at 0
+            height = self._table.scrollable_content_region.height
+            self._table.scroll_to(y=max(0, index - start - height // 2), animate=False, immediate=True)
+        self._table.move_cursor(row=index - start)
+
+    def _on_table_scrolled(self, scroll_y: float) -> None:
+        if not self._recenter_pending and self._row_total() > _WINDOW_ROWS:
+            # Not from inside the scroll watcher — the table may be mid-update
+            self._recenter_pending = True
+            self.call_later(self._recenter_window)
+
+    def _recenter_window(self) -> None:
+        """Slide the window when the viewport nears its edge, keeping the
+        visible rows and the cursor where they are on screen."""
+        self._recenter_pending = False
+        dt = self._table
+        start = self._window_start
+        count = dt.row_count
+        total = self._row_total()
+        height = dt.scrollable_content_region.height
+        top = int(dt.scroll_y)
+        near_top = start > 0 and top < _WINDOW_MARGIN
+        near_bottom = start + count < total and count - (top + height) < _WINDOW_MARGIN
+        if not (near_top or near_bottom):
+            return
+        top_index = start + top
+        cursor_index = start + dt.cursor_row
+        new_start = max(0, min(top_index - (_WINDOW_ROWS - height) // 2, total - _WINDOW_ROWS))
+        if new_start == start:
+            return
+        self._set_window(new_start)
+        # Keep the cursor on screen: the table scrolls to it once the new
+        # rows are measured, which would undo the scroll below otherwise
+        new_top = top_index - new_start
+        cursor_row = min(max(cursor_index - new_start, new_top), new_top + height - 1)
+        dt.move_cursor(row=cursor_row, scroll=False)
+        dt.scroll_to(y=new_top, animate=False, immediate=True)
 
     @on(DataTable.RowHighlighted)
     def _on_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Post FileHighlighted at once after a pause; while a key is held,
+        only for the row the cursor stops on. Each message costs the app a
+        stat and a prefetch read."""
         path = self._get_highlighted_path()
+        if path is None:
+            return
+        now = time.monotonic()
+        moving = now - self._last_highlight < _HIGHLIGHT_DEBOUNCE
+        self._last_highlight = now
+        if self._highlight_timer is not None:
+            self._highlight_timer.stop()
+            self._highlight_timer = None
+        if not moving:
+            self.post_message(FileHighlighted(path))
+            return
+        self._pending_highlight = path
+        self._highlight_timer = self.set_timer(_HIGHLIGHT_DEBOUNCE, self._flush_highlight)
+
+    def _flush_highlight(self) -> None:
+        """Timer callback for _on_row_highlighted."""
+        self._highlight_timer = None
+        path, self._pending_highlight = self._pending_highlight, None
         if path is not None:
             self.post_message(FileHighlighted(path))
 
@@ -467,16 +983,25 @@ class FileBrowser(Widget):
         """Handle Enter key on DataTable — enter directory or open file."""
         self.action_enter_or_open()
 
-    def _get_highlighted_path(self) -> Path | None:
-        """Return the Path of the currently highlighted item."""
-        dt = self.query_one("#file-list", DataTable)
+    def _highlighted_index(self) -> int | None:
+        """Listing index of the highlighted row: -1 for "..", None if empty."""
+        dt = self._table
         if dt.row_count == 0:
             return None
-        try:
-            row_key = dt.coordinate_to_cell_key(dt.cursor_coordinate).row_key.value
-        except Exception:
+        index = self._window_start + dt.cursor_row - self._parent_rows
+        if index >= len(self._names):
+            return None
+        return index
+
+    def _get_highlighted_path(self) -> Path | None:
+        """Return the Path of the currently highlighted item."""
+        index = self._highlighted_index()
+        if index is None:
             return None
-        return self._path_map.get(row_key)
+        if index < 0:
+            return self.current_dir.parent
+        # Built on demand — only the highlighted row ever needs a Path
+        return self.current_dir / self._names[index]
 
     def _navigate_to(self, path: Path) -> None:
         """Change to a new directory."""
@@ -494,18 +1019,20 @@ class FileBrowser(Widget):
     # --- Actions bound to vim keys ---
 
     def action_cursor_down(self) -> None:
-        dt = self.query_one("#file-list", DataTable)
+        dt = self._table
         dt.action_cursor_down()
 
     def action_cursor_up(self) -> None:
-        dt = self.query_one("#file-list", DataTable)
+        dt = self._table
         dt.action_cursor_up()
 
     def action_enter_or_open(self) -> None:
         path = self._get_highlighted_path()
         if path is None:
             return
-        if path.is_dir():
+        # The scan already sorted dirs (and links to them) first, so the row
+        # index says which this is; _navigate_to's is_dir() is the only stat
+        if self._highlighted_index() < self._n_dirs:
             self._navigate_to(path)
         else:
             self.post_message(FileSelected(path))
@@ -514,13 +1041,12 @@ class FileBrowser(Widget):
         self._navigate_to(self.current_dir.parent)
 
     def action_jump_top(self) -> None:
-        dt = self.query_one("#file-list", DataTable)
-        dt.move_cursor(row=0)
+        if self._table.row_count > 0:
+            self._move_to(0)
 
     def action_jump_bottom(self) -> None:
-        dt = self.query_one("#file-list", DataTable)
-        if dt.row_count > 0:
-            dt.move_cursor(row=dt.row_count - 1)
+        if self._table.row_count > 0:
+            self._move_to(self._row_total() - 1)
 
     def action_toggle_hidden(self) -> None:
         self._show_hidden = not self._show_hidden
@@ -528,12 +1054,22 @@ class FileBrowser(Widget):
 
     def action_toggle_perms(self) -> None:
         self._show_perms = not self._show_perms
+        self._forget_dir(self.current_dir)  # show current modes, not cached ones
         self._load_directory()
 
     def action_cycle_sort(self) -> None:
         keys = list(SortKey)
         idx = keys.index(self._sort_key)
         self._sort_key = keys[(idx + 1) % len(keys)]
+        if self._sort_key != SortKey.NAME:
+            # Size and time sorts need current stats: in-place writes change
+            # neither the directory's mtime nor anything the watcher reports
+            self._forget_dir(self.current_dir)
+        self._load_directory()
+
+    def action_refresh(self) -> None:
+        """Rescan the current directory, bypassing the listing cache."""
+        self._forget_dir(self.current_dir)
         self._load_directory()
 
     def action_start_search(self) -> None:
@@ -552,33 +1088,65 @@ class FileBrowser(Widget):
             self._search_matches = []
             self._search_index = -1
             return
-        dt = self.query_one("#file-list", DataTable)
-        has_parent = self.current_dir != Path(self.current_dir.root)
-        offset = 1 if has_parent else 0
+        offset = self._parent_rows
         # Build list of all matching row indices
         matches: list[int] = []
-        if has_parent and query in "..":
+        if offset and query in "..":
             matches.append(0)
-        for i, entry in enumerate(self._entries):
-            if query in entry.name.lower():
-                matches.append(i + offset)
+        prev = self._search_query
+        if prev and prev in query:
+            # Refining the last search (same listing — a reload clears it):
+            # every match must already have matched it
+            lower = self._names_lower
+            matches.extend(r for r in self._search_matches if r >= offset and query in lower[r - offset])
+        else:
+            matches.extend(i + offset for i in self._find_names(query))
         self._search_query = query
         self._search_matches = matches
         if matches:
             self._search_index = 0
-            dt.move_cursor(row=matches[0])
+            self._move_to(matches[0])
         else:
             self._search_index = -1
         self._refresh_subtitle()
         self._update_search_hint(bool(matches))
 
+    def _find_names(self, query: str) -> list[int]:
+        """Indices into _names whose lowercased name contains `query`.
+
+        Names are lowercased once per listing (on its first search) and also
+        joined into one NUL-separated string. A rare query is then a few
+        C-level str.find calls over that string, mapped back to names by
+        bisecting their start offsets; a common one is cheaper as a plain
+        scan of the lowered names, which still skips the per-entry lower().
+        """
+        if self._search_blob is None:
+            self._names_lower = [n.lower() for n in self._names]
+            self._search_blob = "\0".join(self._names_lower)
+            self._search_starts = list(accumulate((len(n) + 1 for n in self._names_lower[:-1]), initial=0))
+        if "\0" in query:
+            return []  # could only match across the separators
+        blob = self._search_blob
+        if blob.count(query) * 32 > len(self._names_lower):
+            return [i for i, n in enumerate(self._names_lower) if query in n]
+        starts = self._search_starts
+        found: list[int] = []
+        pos = blob.find(query)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            found.append(i)
+            # Resume at the next name — each name counts once
+            if i + 1 >= len(starts):
+                break
+            pos = blob.find(query, starts[i + 1])
+        return found
+
     def action_search_next(self) -> None:
         """Jump to the next search match (n)."""
         if not self._search_matches:
             return
         self._search_index = (self._search_index + 1) % len(self._search_matches)
-        dt = self.query_one("#file-list", DataTable)
-        dt.move_cursor(row=self._search_matches[self._search_index])
+        self._move_to(self._search_matches[self._search_index])
         self._refresh_subtitle()
 
     def action_search_prev(self) -> None:
@@ -586,8 +1154,7 @@ class FileBrowser(Widget):
         if not self._search_matches:
             return
         self._search_index = (self._search_index - 1) % len(self._search_matches)
-        dt = self.query_one("#file-list", DataTable)
-        dt.move_cursor(row=self._search_matches[self._search_index])
+        self._move_to(self._search_matches[self._search_index])
         self._refresh_subtitle()
 
     def _refresh_subtitle(self) -> None:
@@ -612,9 +1179,8 @@ class FileBrowser(Widget):
         path = self._get_highlighted_path()
         if path is None or path.is_dir():
             return
-        editor = os.environ.get("EDITOR", "vim")
         with self.app.suspend():
-            subprocess.call([*shlex.split(editor), str(path)])
+            subprocess.call([*editor_command(), str(path)])
 
     def action_open_editor_path(self) -> None:
         path = self._get_highlighted_path()
@@ -634,9 +1200,8 @@ class FileBrowser(Widget):
         if path.is_dir():
             self._navigate_to(path)
             return
-        editor = os.environ.get("EDITOR", "vim")
         with self.app.suspend():
-            subprocess.call([*shlex.split(editor), str(path)])
+            subprocess.call([*editor_command(), str(path)])
 
     def action_touch_file(self) -> None:
         self._input_mode = InputMode.TOUCH
@@ -659,6 +1224,7 @@ class FileBrowser(Widget):
             path.parent.mkdir(parents=True, exist_ok=True)
             path.touch()
             self.notify(f"Created: {path.name}", severity="information")
+            self._forget_dir()  # the typed path may point anywhere
             self._load_directory()
         except OSError as exc:
             self.notify(f"Failed: {exc}", severity="error")
@@ -669,12 +1235,7 @@ class FileBrowser(Widget):
         if path is None:
             return
         # Don't allow renaming ".."
-        dt = self.query_one("#file-list", DataTable)
-        try:
-            row_key = dt.coordinate_to_cell_key(dt.cursor_coordinate).row_key.value
-        except Exception:
-            return
-        if row_key == "..":
+        if self._highlighted_index() < 0:
             return
         self._input_mode = InputMode.RENAME
         self._rename_path = path
@@ -700,6 +1261,7 @@ class FileBrowser(Widget):
         try:
             old_path.rename(new_path)
             self.notify(f"Renamed to: {new_name}", severity="information")
+            self._forget_dir(self.current_dir)
             self._load_directory()
         except OSError as exc:
             self.notify(f"Rename failed: {exc}", severity="error")
@@ -724,6 +1286,7 @@ class FileBrowser(Widget):
         try:
             new_path.mkdir(parents=True)
             self.notify(f"Created: {dir_name}/", severity="information")
+            self._forget_dir(self.current_dir)
             self._load_directory()
         except OSError as exc:
             self.notify(f"Mkdir failed: {exc}", severity="error")
@@ -788,6 +1351,7 @@ class FileBrowser(Widget):
             subprocess.call(full_cmd, shell=True, cwd=str(self.current_dir))
             print()
             input("\033[2mpress Enter to continue\033[0m")
+        self._forget_dir()
         self._load_directory()
 
     def action_yank_path(self) -> None:
@@ -805,12 +1369,7 @@ class FileBrowser(Widget):
         if path is None:
             return
         # Don't allow deleting ".."
-        dt = self.query_one("#file-list", DataTable)
-        try:
-            row_key = dt.coordinate_to_cell_key(dt.cursor_coordinate).row_key.value
-        except Exception:
-            return
-        if row_key == "..":
+        if self._highlighted_index() < 0:
             return
 
         kind = "directory" if path.is_dir() else "file"
@@ -827,6 +1386,7 @@ class FileBrowser(Widget):
                 else:
                     path.unlink()
                 self.notify(f"Deleted {kind}: {name}", severity="information")
+                self._forget_dir(self.current_dir)
                 self._load_directory()
             except OSError as exc:
                 self.notify(f"Delete failed: {exc}", severity="error")
@@ -17,7 +17,7 @@ def _git_info(directory: Path) -> tuple[str | None, bool | None]:
     """Return (branch_name, is_dirty) or (None, None) if not a repo."""
     try:
         result = subprocess.run(
-            ["git", "status", "--porcelain", "-b", "-uno"],
+            ["git", "--no-optional-locks", "status", "--porcelain", "-b", "-uno"],
             cwd=str(directory),
             capture_output=True,
             text=True,
@@ -72,6 +72,7 @@ class PathBar(Widget):
     def __init__(self, path: Path | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self._path = path or Path.cwd()
+        self._shown_path: Path | None = None  # path the bar currently renders
 
     def compose(self):
         yield Static(id="path-text")
@@ -109,12 +110,15 @@ class PathBar(Widget):
 
     def update_path(self, path: Path) -> None:
         self._path = path.absolute()
-        # Render immediately without git info (no latency)
-        text = self._render_bar(self._path)
-        try:
-            self.query_one("#path-text", Static).update(text)
-        except Exception:
-            pass
+        if self._path != self._shown_path:
+            self._shown_path = self._path
+            # Render immediately without git info (no latency); a reload of
+            # the same directory keeps the old branch shown until the refresh
+            text = self._render_bar(self._path)
+            try:
+                self.query_one("#path-text", Static).update(text)
+            except Exception:
+                pass
         # Fetch git info in background, then re-render
         self._fetch_git_info(self._path)
 
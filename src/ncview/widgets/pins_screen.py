@@ -12,7 +12,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Input, Label, ListItem, ListView, Static
 
 from ncview.utils.clipboard import copy_to_clipboard
-from ncview.utils.pins import Pin, add_pin, load_pins, remove_pin
+from ncview.utils.pins import Pin, add_pin, load_pins, normalize_pin_path, remove_pin
 
 
 def _pin_label(pin: Pin) -> Text:
@@ -238,7 +238,7 @@ class PinsScreen(ModalScreen[Path | None]):
         if not path_str:
             self._finish_add()
             return
-        path = Path(path_str).resolve()
+        path = Path(normalize_pin_path(path_str))
         if not path.is_dir():
             self.app.notify(f"Not a directory: {path}", severity="error")
             return
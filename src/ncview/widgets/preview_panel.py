@@ -29,6 +29,11 @@ class PreviewPanel(Widget):
         self._current_viewer: BaseViewer | None = None
         self._current_path: Path | None = None
 
+    @property
+    def current_path(self) -> Path | None:
+        """The file being shown, or None."""
+        return self._current_path
+
     def compose(self):
         vs = VerticalScroll(id="preview-scroll")
         vs.can_focus = True